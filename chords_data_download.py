@@ -9,6 +9,9 @@ To use this script, fill out the user parameters before the main program.
 User Parameter Breakdown:
     - null_value: [OPTIONAL] Enter whatever value should be used to signal no data (e.g. -999.99 or 'NaN'). Empty string by default (creates smaller files).
     - include_test: [OPTIONAL] Set to True to include boolean columns next to each data column which specify whether data collected was test data (False by default).
+    - compress_output: [OPTIONAL] Set to True to write gzip-compressed CSV files (.csv.gz), which are much smaller on disk (False by default).
+    - use_cache: [OPTIONAL] Reuse API responses saved in the '.chords_cache' folder under data_path by earlier runs instead of downloading them again (True by default).
+                 Only time frames that ended more than a day ago are cached. Set to False to always download fresh data.
     - portal_url: The url for the CHORDS online portal.
     - portal_name: The name of the CHORDS portal, choose from this list (case sensitive): Barbados, Trinidad, 3D PAWS, 3D Calibration, FEWNSET, Kenya, Cayman Islands
     - data_path: The absolute folder path specifying where the CSV files should be printed to locally.
@@ -61,11 +64,13 @@ Usage:
 
 """
 import requests
-from json import dumps
-from json import loads
 import numpy as np
 from datetime import datetime, timedelta
 import sys
+import os
+from time import perf_counter
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import resources
 
 
@@ -73,6 +78,8 @@ import resources
 
 null_value = '' # OPTIONAL
 include_test = False # OPTIONAL
+compress_output = False # OPTIONAL
+use_cache = True # OPTIONAL
 
 portal_url = r"https://chords.portal.com/"
 portal_name = "PORTAL NAME"
@@ -91,11 +98,74 @@ time_window_end = 'HH:MM:SS'
 
 # MAIN PROGRAM ------------------------------------------------------------------------------------------------------------------------
 
+PORTAL_LOOKUP = frozenset({
+    'Barbados', 'Trinidad', '3D PAWS', '3D Calibration', 'FEWSNET', 'Kenya', 'Cayman Islands', 'Dominican Republic'
+})
+FORMAT_STR = "%Y-%m-%d %H:%M:%S" # format of the 'start' and 'end' user parameters
+WINDOW_FORMAT_STR = "%H:%M:%S" # format of the 'time_window_start' and 'time_window_end' user parameters
+
+"""
+Submits the API requests for a single instrument to the executor in main() -- one per week-long shard of the time frame, or one per 
+day if a time window was specified. Returns the futures of the requests in time order, each resolving to a list 
+[time, measurements, test, total_num_measurements].
+"""
+def _submit_instrument(executor:ThreadPoolExecutor, iD, session:requests.Session, timestamp_start:datetime, timestamp_end:datetime, \
+                                                    timestamp_window_start, timestamp_window_end) -> list:
+    with resources.PRINT_LOCK:
+        print(f"---> Reading instrument ID {iD}")
+
+    cache_dir = os.path.join(data_path, '.chords_cache') if use_cache else None
+    if time_window_start == "" and time_window_end == "":
+        return [executor.submit(resources.fetch_range, session, int(iD), shard_start, shard_end, portal_url, user_email, api_key, cache_dir) \
+                    for shard_start, shard_end in resources.shard_range(timestamp_start, timestamp_end)]
+
+    # if a time window was specified by user
+    with resources.PRINT_LOCK:
+        print(f"\t\t Time window specified for instrument ID {iD}.\n\t\t Returning data from {time_window_start} -> {time_window_end}")
+    return [executor.submit(resources.fetch_window, session, int(iD), window_begin, window_stop, portal_url, user_email, api_key, cache_dir) \
+                for window_begin, window_stop in resources.window_range(timestamp_start, timestamp_end, timestamp_window_start, timestamp_window_end)]
+
+"""
+Transcribes the downloaded data for a single instrument, once all of its requests submitted by _submit_instrument() have completed, 
+and writes it to the instrument's csv file, or a warning file if no data was found. 't_start' is the time the downloads were started.
+"""
+def _write_instrument(iD, instrument_requests:list, t_start:float, timestamp_start:datetime, timestamp_end:datetime, out_dir:Path):
+    data = resources.merge_data([request.result() for request in instrument_requests]) # a list [time, measurements, test, total_num_measurements]
+    with resources.PRINT_LOCK:
+        print(f"---> Downloaded instrument ID {iD} in {perf_counter() - t_start:.2f}s")
+
+    time = data[0] # list of strings  (e.g. '2023-12-17T00:00:04Z')
+    measurements = data[1] # list of dictionaries  (e.g. {'t1': 25.3, 'uv1': 2, 'rh1': 92.7, 'sp1': 1007.43, 't2': 26.9, 'vis1': 260, 'ir1': 255, 'msl1': 1013.01, 't3': 26.1})
+    test = data[2] # list of strings of whether data point is a test value (either 'true' or 'false')
+    total_num_measurements = data[3]
+
+    headers = resources.build_headers(measurements, columns_desired, include_test, portal_name) # list of strings 
+
+    # pre-sized object arrays filled in a single pass -- skips np.array()'s extra scan to infer a dtype for each list
+    time = np.fromiter(time, dtype=object, count=len(time))
+    measurements = np.fromiter(measurements, dtype=object, count=len(measurements))
+    test = np.fromiter(test, dtype=object, count=len(test))
+    
+    t0 = perf_counter()
+    if resources.struct_has_data(measurements, time, test): 
+        file_path = out_dir / f"{portal_name}_ID{iD}_{timestamp_start.date()}_{timestamp_end.date()}.csv"
+        resources.csv_builder(headers, time, measurements, test, str(file_path), include_test, null_value, compress_output)
+        with resources.PRINT_LOCK:
+            print(f"---> Finished writing instrument ID {iD} to file in {perf_counter() - t0:.2f}s")
+            print(f"\t Total number of measurements: {total_num_measurements}")
+    else:
+        with resources.PRINT_LOCK:
+            print("\t ========================= WARNING =========================")
+            print(f"\t No data found at specified timeframe for {portal_name} Instrument ID: {iD}\n")
+        file_path = out_dir / f"{portal_name}_instrumentID_{iD}_[WARNING].txt"
+        with open(file_path, 'w') as file:
+            file.write("No data was found for the specified time frame.\nCheck the CHORDS portal to verify.")
+
+
 def main():
     # user input validation
-    format_str = "%Y-%m-%d %H:%M:%S"
-    timestamp_start = datetime.strptime(start, format_str) 
-    timestamp_end = datetime.strptime(end, format_str)
+    timestamp_start = datetime.strptime(start, FORMAT_STR) 
+    timestamp_end = datetime.strptime(end, FORMAT_STR)
     if timestamp_start > timestamp_end:
             raise ValueError(f"Starting time cannot be after end time.\n\t\t\tStart: {timestamp_start}\t\tEnd: {timestamp_end}")
     if timestamp_start < datetime.now() - timedelta(days=365*2):
@@ -105,92 +175,67 @@ def main():
         print("\t ========================= WARNING =========================")
         print(f"\t timestamp_end in the future: {timestamp_end}\n\t Will pull up to today's date only.\n")
 
+    timestamp_window_start = None
+    timestamp_window_end = None
     if time_window_start != "" or time_window_end != "":
-        format_str = "%H:%M:%S"
-        timestamp_window_start = datetime.strptime(time_window_start, format_str).time()
-        timestamp_window_end = datetime.strptime(time_window_end, format_str).time()
+        timestamp_window_start = datetime.strptime(time_window_start, WINDOW_FORMAT_STR).time()
+        timestamp_window_end = datetime.strptime(time_window_end, WINDOW_FORMAT_STR).time()
         if time_window_start > time_window_end:
             raise ValueError(f"The start time for the time window is after the end time: {time_window_start} > {time_window_end}")
         if time_window_start == "" or time_window_end == "":
             raise ValueError(f"Both the 'time_window_start' and 'time_window_end' variables must be populated to specify a collection timeframe.")
 
-    portal_lookup = [
-        'Barbados', 'Trinidad', '3D PAWS', '3D Calibration', 'FEWSNET', 'Kenya', 'Cayman Islands', 'Dominican Republic'
-    ]
-    if portal_name not in portal_lookup:
+    if portal_name not in PORTAL_LOOKUP:
         raise ValueError(f"Please enter one of the following portal names as they appear here (case sensitive):\n\t \
-                            Barbados, Trinidad, 3D PAWS, 3D Calibration, FEWSNET, Kenya, Cayman Islands")
-    
-    # processing loop
-    for iD in instrument_IDs:
+                            Barbados, Trinidad, 3D PAWS, 3D Calibration, FEWSNET, Kenya, Cayman Islands, Dominican Republic")
+
+    for iD in instrument_IDs: # validate every id up front, before any download is started
         if not isinstance(iD, int):
             raise TypeError(f"The instrument id's must be integers, passed {type(iD)} for id {iD}")
-
-        print(f"---> Reading instrument ID {iD}\t\t\t\t\t\t\t{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-
-        if time_window_start == "" and time_window_end == "":
-            time = [] # list of strings  (e.g. '2023-12-17T00:00:04Z')
-            measurements = [] # list of dictionaries  (e.g. {'t1': 25.3, 'uv1': 2, 'rh1': 92.7, 'sp1': 1007.43, 't2': 26.9, 'vis1': 260, 'ir1': 255, 'msl1': 1013.01, 't3': 26.1})
-            test = [] # list of strings of whether data point is a test value (either 'true' or 'false')
-
-            total_num_measurements = 0
-            total_num_timestamps = 0
-
-            url = f"{portal_url}/api/v1/data/{iD}?start={start}&end={end}&email={user_email}&api_key={api_key}"
-            response = requests.get(url=url)
-            all_fields = loads(dumps(response.json())) # dictionary containing deep copy of JSON-formatted CHORDS data
-            if resources.has_errors(all_fields):
-                sys.exit(1)
-            
-            if resources.has_excess_datapoints(all_fields): # reduce timeframe in API call
-                print("\t Large data request -- reducing.")
-                reduced_data = resources.reduce_datapoints(all_fields['errors'][0], int(iD), timestamp_start, timestamp_end, \
-                                                    portal_url, user_email, api_key, null_value)    # list
-                                                                                        # e.g. [time, measurements, test, total_num_measurements]
-                time = reduced_data[0]
-                measurements = reduced_data[1]
-                test = reduced_data[2]
-                total_num_measurements = reduced_data[3]
-            else:
-                data = all_fields['features'][0]['properties']['data']  # list of dictionaries 
-                                                                        # ( e.g. {'time': '2023-12-17T18:45:56Z', 'test': 'false', 'measurements': {'ws': 1.55, 'rain': 1}} )
-                for i in range(len(data)):
-                    t = resources.get_time(data[i]['time'])
-                    time.append(str(data[i]['time']))
-                    total_num_measurements += len(data[i]['measurements'].keys())
-                    total_num_timestamps += 1
-                    to_append = resources.write_compass_direction(dict(data[i]['measurements']), null_value)
-                    measurements.append(to_append)
-                    test.append(str(data[i]['test']))
-
-                        
-        else: # if a time window was specified by user
-            print(f"\t\t Time window specified.\n\t\t Returning data from {time_window_start} -> {time_window_end}")
-            window_data = resources.time_window(int(iD), timestamp_start, timestamp_end, timestamp_window_start, timestamp_window_end, \
-                                        portal_url, user_email, api_key, null_value) # a list [time, measurements, test, total_num_measurements]
-            time = window_data[0]
-            measurements = window_data[1]
-            test = window_data[2]
-            total_num_measurements = window_data[3]
-
-        headers = resources.build_headers(measurements, columns_desired, include_test, portal_name) # list of strings 
-        time = np.array(time)
-        measurements = np.array(measurements)
-        test = np.array(test)
-        
-        if resources.struct_has_data(measurements, time, test): 
-            csv = f"\\{portal_name}_ID{iD}_{timestamp_start.date()}_{timestamp_end.date()}.csv"
-            file_path = data_path + csv
-            resources.csv_builder(headers, time, measurements, test, file_path, include_test, null_value)
-            print(f"\t Finished writing to file.\t\t\t\t\t\t{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            print(f"\t Total number of measurements: {total_num_measurements}")
-        else:
-            print("\t ========================= WARNING =========================")
-            print(f"\t No data found at specified timeframe for {portal_name} Instrument ID: {iD}\n")
-            txt = f"\\{portal_name}_instrumentID_{iD}_[WARNING].txt"
-            file_path = data_path + txt
-            with open(file_path, 'w') as file:
-                file.write("No data was found for the specified time frame.\nCheck the CHORDS portal to verify.")
+    
+    out_dir = Path(data_path)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    # processing loop -- downloads are network-bound, so the requests of every instrument share one bounded pool, and each 
+    # instrument is written as soon as its last request completes
+    t_start = perf_counter()
+    with resources.create_session(resources.MAX_REQUEST_WORKERS) as session, \
+                                            ThreadPoolExecutor(max_workers=resources.MAX_REQUEST_WORKERS) as executor:
+        requests_by_instrument = [
+            _submit_instrument(executor, iD, session, timestamp_start, timestamp_end, timestamp_window_start, timestamp_window_end) \
+                for iD in instrument_IDs
+        ] # futures of every instrument's requests, in time order
+        futures = {future: i for i, instrument_requests in enumerate(requests_by_instrument) for future in instrument_requests}
+        remaining = [len(instrument_requests) for instrument_requests in requests_by_instrument]
+
+        try:
+            for i, num_requests in enumerate(remaining):
+                if num_requests == 0: # e.g. no day in the time frame holds the window
+                    _write_instrument(instrument_IDs[i], [], t_start, timestamp_start, timestamp_end, out_dir)
+
+            for future in as_completed(futures):
+                i = futures[future]
+                future.result() # a fatal error in any request ends the run right away, not once its instrument is complete
+                remaining[i] -= 1
+                num_done = len(requests_by_instrument[i]) - remaining[i]
+                if timestamp_window_start is not None and num_done % 100 == 0: # progress through long time window requests
+                    with resources.PRINT_LOCK:
+                        if num_done == 100:
+                            print(f"\t\t Large data request for instrument ID {instrument_IDs[i]}.")
+                        print(f"\t\t\t Getting next data segment for instrument ID {instrument_IDs[i]}...")
+
+                if remaining[i] == 0:
+                    _write_instrument(instrument_IDs[i], requests_by_instrument[i], t_start, timestamp_start, timestamp_end, out_dir)
+        except resources.DownloadError as error: # raised by a worker thread, for an error that ends the run
+            executor.shutdown(wait=False, cancel_futures=True) # don't wait for the other instruments to finish downloading first
+            with resources.PRINT_LOCK:
+                print("\t ======================= ERROR =======================")
+                print(f"\t Instrument ID: {error.iD}")
+                print(error.message)
+            sys.exit(1)
+        except BaseException: # e.g. an invalid column in build_headers(), or Ctrl+C
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
 
     #resources.create_README(portal_name, data_path)
 
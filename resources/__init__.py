@@ -1,2 +1,3 @@
 from .classes import *
 from .functions import *
+from .cache import *
@@ -0,0 +1,215 @@
+# README payloads -------------------------------------------------------------------------------------------------------------------
+
+"""
+Data module for create_README(). Holds the units of measurement guide of each portal as a list of 
+(sensor name, shortname, measured property, units) rows, with None for a blank line between groups of sensors, and a string
+for a line that does not follow the portal's tab stops and is written as-is. The title and column header lines of each guide
+are kept as written as well. functions.py lays each one out with format_readme() the first time its README is needed.
+"""
+
+BARBADOS_HEADING = ( # title and column header lines, Barbados
+    '============================= Units of measurement guide =========================',
+    'Sensor name\t(shortname)\t\tMeasured Property\t\t(units)',
+)
+TRINIDAD_HEADING = ( # Trinidad
+    '=================================== Units of measurement guide ===============================',
+    'Sensor name\t(shortname)\t\tMeasured Property\t\t\t(units)',
+)
+GUIDE_HEADING = ( # 3D PAWS, 3D Calibration, FEWSNET, Dominican Republic
+    '================================= Units of measurement guide =============================',
+    'Sensor name\t\t\t(shortname)\t\tMeasured Property\t(units)',
+)
+
+BARBADOS_README = [ # Barbados
+    ('HTU21D_T', 't1', 'Temperature', 'degrees C'),
+    ('BMP280_T', 't2', 'Temperature', 'degrees C'),
+    ('MCP9808_T', 't3', 'Temperature', 'degrees C'),
+    ('HTU21D_RH', 'rh1', 'Humidity Value', 'percent %'),
+    ('BMP280_SLP', 'msl1', 'Air Pressure Value', 'millibar mbar'),
+    ('BMP280_SP', 'sp1', 'Air Pressure Value', 'millibar mbar'),
+    ('windspeed', 'ws', 'Wind Speed', 'meters per second m/s'),
+    ('winddirection', 'wd', 'Wind Direction', 'degrees N degN'),
+    ('precipitation', 'rain', 'Precipitation', 'millimeter mm'),
+    ('SI1145_VIS', 'vis1', 'Downwelling Irradiance', 'watts per square meter W/m^2'),
+    ('SI1145_IR', 'ir1', 'Downwelling Irradiance', 'watts per square meter W/m^2'),
+    ('SI1145_UV', 'uv1', 'Downwelling Irradiance', 'watts per square meter W/m^2'),
+]
+TRINIDAD_README = [ # Trinidad
+    ('BMX280 Temperature', 'bt1', 'Temperature', 'degrees C'),
+    ('MCP9808 Temperature', 'mt1', 'Temperature', 'degrees C'),
+    ('HTU21D Temperature', 'ht1', 'Temperature', 'degrees C'),
+    ('BMX280 Pressure', 'bp1', 'Air Pressure Value', 'hectopascal hPa'),
+    ('BMX280 Relative Humidity', 'bh1', 'Humidity Value', 'percent %'),
+    ('HTU21D Relative Humidity', 'hh1', 'Humidity Value', 'percent %'),
+    ('Wind Speed', 'ws', 'Wind Speed', 'meters per second m/s'),
+    ('Wind Direction', 'wd', 'Wind Direction', 'degrees N degN'),
+    ('Wind Gust', 'wg', 'Wind Speed', 'meters per second m/s'),
+    ('Wind Gust Direction', 'wgd', 'Wind Direction', 'degrees N degN'),
+    ('Rain Gauge', 'rg', 'Precipitation', 'millimeter mm'),
+    ('SI1145 Visible', 'sv1', 'Downwelling Irradiance', 'watts per square meter W/m^2'),
+    ('SI1145 Infrared', 'si1', 'Downwelling Irradiance', 'watts per square meter W/m^2'),
+    ('SI1145 Ultraviolet', 'su1', 'Downwelling Irradiance', 'watts per square meter W/m^2'),
+    ('Battery Current State', 'bcs', 'State of Health', 'count #'),
+    ('Battery Percent Charge', 'bpc', 'State of Health', 'percent %'),
+    ('Battery Charge Fault Register', 'cfr', 'State of Health', 'count #'),
+    ('Cell Signal Strength', 'css', 'State of Health', 'percent %'),
+]
+THREED_README = [ # 3D PAWS
+    ('HTU21D_T', 't1', 'Temperature', 'degrees C'),
+    ('HTU21D Temperature', 'ht1', 'Temperature', 'degrees C'),
+    ('HIH Temperature 2', 'ht2', 'Temperature', 'degrees C'),
+    ('HTU21D_T', 'htu21d_temp', 'Temperature', 'degrees C'),
+    ('BMP280_T', 't2', 'Temperature', 'degrees C'),
+    ('BMP280_T', 'bmp_temp', 'Temperature', 'degrees C'),
+    ('BME_T', 'bme_temp', 'Temperature', 'degrees C'),
+    ('BMX280 Temperature 1', 'bt1', 'Temperature', 'degrees C'),
+    ('MCP9808_T', 't3', 'Temperature', 'degrees C'),
+    ('MCP9808_T', 'mcp9808', 'Temperature', 'degrees C'),
+    ('MCP9808 Temperature 1', 'mt1', 'Temperature', 'degrees C'),
+    ('SHT Temperature', 'st1', 'Temperature', 'degrees C'),
+    None,
+    ('BMP280_ALT', 'bmp_altitude', 'Altitude', 'meter m'),
+    None,
+    ('BMP280_SLP', 'msl1', 'Air Pressure Value', 'millibar mbar'),
+    ('BMP280_SLP', 'bmp_slp', 'Air Pressure Value', 'hectopascal hPa'),
+    ('BMP280_SP', 'sp1', 'Air Pressure Value', 'millibar mbar'),
+    ('BMP280_SP', 'bmp_pressure', 'Air Pressure Value', 'hectopascal hPa'),
+    ('BME_StationPres', 'bme_pressure', 'Air Pressure Value', 'hectopascal hPa'),
+    ('BME_SeaLevelPres', 'bme_slp', 'Air Pressure Value', 'hectopascal hPa'),
+    ('BMX280 Pressure 1', 'bp1', 'Air Pressure Value', 'hectopascal hPa'),
+    None,
+    ('Wind speed', 'ws', 'Wind Speed', 'meters per second m/s'),
+    ('windspeed', 'wind_speed', 'Wind Speed', 'meters per second m/s'),
+    ('Wind direction', 'wd', 'Wind Direction', 'degrees N degN'),
+    ('winddirection', 'wind_direction', 'Wind Direction', 'degrees N degN'),
+    ('Wind Gust', 'wg', 'Wind Speed', 'meters per second m/s'),
+    ('Wind Gust Direction', 'wgd', 'Wind Direction', 'degrees N degN'),
+    None,
+    ('HTU21D_RH', 'rh1', 'Humidity Value', 'percent %'),
+    ('HTU21D_RH', 'htu21d_humidity', 'Humidity Value', 'percent %'),
+    ('BMX280 Relative Humidity', 'bh1', 'Humidity Value', 'percent %'),
+    ('BME_RH', 'bme_humidity', 'Humidity Value', 'percent %'),
+    ('HTU21D Relative Humidity', 'hh1', 'Humidity Value', 'percent %'),
+    ('HIH Humidity 2', 'hh2', 'Humidity Value', 'percent %'),
+    ('Relative Humidity', 'sh1', 'Humidity Value', 'percent %'),
+    None,
+    ('Rain', 'rain', 'Precipitation', 'millimeter mm'),
+    ('Rain Gauge Total Today', 'rgt', 'Precipitation', 'millimeter mm'),
+    ('Station Rain Gauge', 'rg', 'Precipitation', 'millimeter mm'),
+    ('Rain Gauge Total Prior', 'rgp', 'Precipitation', 'millimeter mm'),
+    'Rain_Gauge_Delta_Seconds\t(rgds)\t\t\tTime Measurement Accuracy (seconds s)', # kept exactly as laid out by hand in the original guide
+    None,
+    ('Water level', 'hl', 'Datum', 'millimeter mm'),
+    ('Water level outliers', 'wlo', 'Number of Samples', 'count #'),
+    ('Water level deviation', 'wld', 'Deviation', 'millimeter mm'),
+    ('Water level median', 'wlm', 'Datum', 'millimeter #'),
+    ('Water level raw', 'wlr', 'Datum', 'millimeter mm'),
+    None,
+    ('Snow_Depth', 'sg', 'Datum', 'centimeter cm'),
+    None,
+    ('Soil Temperature 1', 'st1', 'Temperature', 'degrees C'),
+    ('Soil Temperature 2', 'st2', 'Temperature', 'degrees C'),
+    ('Soil Temperature 3', 'st3', 'Temperature', 'degrees C'),
+    ('Soil Moisture 1', 'sm1', 'Data Point', 'percent saturation % Sat'),
+    ('Soil Moisture 2', 'sm2', 'Data Point', 'kilopascal kPa'),
+    ('Soil Moisture 3', 'sm3', 'Data Point', 'percent saturation % Sat'),
+    None,
+    ('SI1145 Visible 1', 'sv1', 'Downwelling Irradiance', 'watts per square meter W/m^2'),
+    ('SI1145 Infrared 1', 'si1', 'Downwelling Irradiance', 'watts per square meter W/m^2'),
+    ('SI1145 Ultraviolet 1', 'su1', 'Downwelling Irradiance', 'watts per square meter W/m^2'),
+    ('SI1145_VIS', 'vis1', 'Downwelling Irradiance', 'watts per square meter W/m^2'),
+    ('SI1145_IR', 'ir1', 'Downwelling Irradiance', 'watts per square meter W/m^2'),
+    ('SI1145_UV', 'uv1', 'Downwelling Irradiance', 'watts per square meter W/m^2'),
+    ('SI1145_VIS', 'si1145_vis', 'Downwelling Irradiance', 'watts per square meter W/m^2'),
+    ('SI1145_IR', 'si1145_ir', 'Downwelling Irradiance', 'watts per square meter W/m^2'),
+    ('SI1145_UV', 'si1145_uv', 'Downwelling Irradiance', 'watts per square meter W/m^2'),
+    ('SP_215', 'solar1', 'Downwelling Irradiance', 'watts per square meter W/m^2'),
+    ('SP_212', 'solar2', 'Downwelling Irradiance', 'watts per square meter W/m^2'),
+    ('SI1145_visible1', 'si1145_vis1', 'Downwelling Irradiance', 'count #'),
+    ('SI11145_infrared1', 'si1145_ir1', 'Downwelling Irradiance', 'count #'),
+    ('SI1145_UV1', 'si1145_uv1', 'Downwelling Irradiance', 'count #'),
+    ('SI1145_visible2', 'si1145_vis2', 'Downwelling Irradiance', 'count #'),
+    ('SI1145_infrared2', 'si1145_ir2', 'Downwelling Irradiance', 'count #'),
+    ('SI1145_UV2', 'si1145_uv2', 'Downwelling Irradiance', 'count #'),
+    ('SI1145_visible3', 'si1145_vis3', 'Downwelling Irradiance', 'count #'),
+    ('SI11145_infrared3', 'si1145_ir3', 'Downwelling Irradiance', 'count #'),
+    ('SI1145_UV3', 'si1145_uv3', 'Downwelling Irradiance', 'count #'),
+    ('SI1145_visible4', 'si1145_vis4', 'Downwelling Irradiance', 'count #'),
+    ('SI11145_infrared4', 'si1145_ir4', 'Downwelling Irradiance', 'count #'),
+    ('SI1145_UV4', 'si1145_uv4', 'Downwelling Irradiance', 'count #'),
+    ('VEML770 light sensor', 'lx', 'Downwelling Irradiance', 'count #'),
+    None,
+    ('Battery Current State', 'bcs', 'State of Health', 'count #'),
+    ('Battery Percent Charge', 'bpc', 'State of Health', 'percent %'),
+    ('Battery Charge Fault Register', 'cfr', 'State of Health', 'count #'),
+    ('Battery Voltage', 'bv', 'State of Health', 'volts V'),
+    ('Cell Signal Strength', 'css', 'State of Health', 'percent %'),
+    ('Health 16bits', 'hth', 'State of Health', 'count #'),
+    None,
+]
+THREED_CAL_README = [ # 3D Calibration
+    ('HTU21D_T', 'htu21d_temp', 'Temperature', 'degrees C'),
+    ('BMP280_T', 'bmp_temp', 'Temperature', 'degrees C'),
+    ('MCP9808_T', 'mcp9808', 'Temperature', 'degrees C'),
+    ('HTU21D_T', 'sht31d_temp', 'Temperature', 'degrees C'),
+    ('HTU21D_RH', 'sht31d_humidity', 'Humidity Value', 'percent %'),
+    ('HTU21D_RH', 'htu21d_humidity', 'Humidity Value', 'percent %'),
+    ('BMP280_SLP', 'bmp_slp', 'Air Pressure Value', 'millibar mbar'),
+    ('BMP280_SP', 'bmp_pressure', 'Air Pressure Value', 'millibar mbar'),
+    ('rain', 'rain', 'Precipitation', 'millimeter mm'),
+    ('windspeed', 'wind_speed', 'Wind Speed', 'meters per second m/s'),
+    ('winddirection', 'wind_direction', 'Wind Direction', 'degrees N degN'),
+    ('Wind Gust', 'wg', 'Wind Speed', 'meters per second m/s'),
+    ('Wind Gust Direction', 'wgd', 'Wind Direction', 'degrees N degN'),
+    ('SI1145_VIS', 'si1145_vis', 'Radiance', 'watts per square meter W/m^2'),
+    ('SI1145_IR', 'si1145_ir', 'Radiance', 'watts per square meter W/m^2'),
+    ('SI1145_UV', 'si1145_uv', 'Radiance', 'watts per square meter W/m^2'),
+    ('Battery Percent Charge', 'bpc', 'State of Health', 'percent %'),
+]
+FEWSNET_README = [ # FEWSNET
+    ('BMX Temperature 1', 'bt1', 'Temperature', 'degrees C'),
+    ('BMX Temperature 2', 'bt2', 'Temperature', 'degrees C'),
+    ('HTU Temperature 1', 'ht1', 'Temperature', 'degrees C'),
+    ('HIH Temperature', 'ht2', 'Temperature', 'degrees C'),
+    ('SHT Temperature', 'st1', 'Temperature', 'degrees C'),
+    ('MCP Temperature 1', 'mt1', 'Temperature', 'degrees C'),
+    ('BMX Humidity 1', 'bh1', 'Humidity Value', 'percent %'),
+    ('BMX Humidity 2', 'bh2', 'Humidity Value', 'percent %'),
+    ('HTU Humidity 1', 'hh1', 'Humidity Value', 'percent %'),
+    ('HIH Humidity', 'hh2', 'Humidity Value', 'percent %'),
+    ('SHT Humidity', 'sh1', 'Humidity Value', 'percent %'),
+    'BMX Pressure 1\t\t\t\tt(bp1)\tAir Pressure Value\t(hectopascal hPa)', # kept exactly as laid out by hand in the original guide
+    'BMX Pressure 2\t\t\t\t\t(bp2)\tAir Pressure Value\t(hectopascal hPa)', # kept exactly as laid out by hand in the original guide
+    ('Rain Gauge 1', 'rg1', 'Precipitation', 'millimeter mm'),
+    ('Rain Gauge 2', 'rg2', 'Precipitation', 'millimeter mm'),
+    'Rain Gauge 1 Total Today\t(rgt1)\t\t\tPrecipitation\t\t(millimeter mm)', # kept exactly as laid out by hand in the original guide
+    'Rain Gauge 2 Total Today\t(rgt2)\t\t\tPrecipitation\t\t(millimeter mm)', # kept exactly as laid out by hand in the original guide
+    'Rain Gauge 1 Total Prior\t(rgp1)\t\t\tPrecipitation\t\t(millimeter mm)', # kept exactly as laid out by hand in the original guide
+    'Rain Gauge 2 Total Prior\t(rgp2)\t\t\tPrecipitation\t\t(millimeter mm)', # kept exactly as laid out by hand in the original guide
+    'Health\t\t\t\t(hth)\t\tState of Health\t\t(count #)', # kept exactly as laid out by hand in the original guide
+    None,
+    ('Battery Percent Charge', 'bpc', 'State of Health', 'percent %'),
+    ('Battery Current State', 'bcs', 'State of Health', 'count #'),
+    ('Cell Signal Strength', 'css', 'State of Health', 'percent %'),
+    ('Battery Charge Fault Register', 'cfr', 'State of Health', 'count #'),
+]
+DOMINICAN_README = [ # Dominican Republic
+    ('BMP280_T', 'bt1', 'Temperature', 'degrees C'),
+    ('HTU21D_T', 'ht1', 'Temperature', 'degrees C'),
+    ('MCP9808', 'mt1', 'Temperature', 'degrees C'),
+    ('HTU21D_RH', 'hh1', 'Humidity Value', 'percent %'),
+    ('BMP280_SLP', 'bmp_pressure', 'Air Pressure Value', 'hectopascal hPa'),
+    ('BMP280_SP', 'bp1', 'Air Pressure Value', 'hectopascal hPa'),
+    ('Precipitation', 'rg', 'Precipitation', 'millimeter mm'),
+    ('Wind Speed', 'ws', 'Wind Speed', 'meters per second m/s'),
+    ('Wind Direction', 'wd', 'Wind Direction', 'degrees N degN'),
+    ('Wind Gust', 'wg', 'Wind Speed', 'meters per second m/s'),
+    ('Wind Gust Direction', 'wgd', 'Wind Direction', 'degrees N degN'),
+    None,
+    ('SI1145_VIS', 'sv1', 'Radiance', 'watts per square meter W/m^2'),
+    ('SI1145_IR', 'si1', 'Radiance', 'watts per square meter W/m^2'),
+    ('SI1145_UV', 'su1', 'Radiance', 'watts per square meter W/m^2'),
+    ('Health', 'hth', 'State of Health', 'dimensionless'),
+    None,
+    ('Battery Percent Charge', 'bpc', 'State of Health', 'percent %'),
+]
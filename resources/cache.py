@@ -0,0 +1,70 @@
+import requests
+import hashlib
+import gzip
+import os
+import tempfile
+
+# Cache -----------------------------------------------------------------------------------------------------------------------------
+
+"""
+Helper function for load_cached() and store_cached(). Returns the path of the file in which the response to 'url' is cached. 
+The URL carries the portal, instrument id, time frame, and credentials, so its sha256 digest gives every distinct API request its 
+own entry.
+"""
+def cache_path(url:str, cache_dir:str) -> str:
+    if not isinstance(url, str):
+        raise TypeError(f"The 'url' parameter in cache_path() should be of type <str>, passed: {type(url)}")
+    if not isinstance(cache_dir, str):
+        raise TypeError(f"The 'cache_dir' parameter in cache_path() should be of type <str>, passed: {type(cache_dir)}")
+
+    return os.path.join(cache_dir, hashlib.sha256(url.encode('utf-8')).hexdigest() + '.json.gz')
+
+"""
+Helper function for load_cached() and store_cached(). Returns the fully encoded URL of the request, which the cache is keyed on.
+"""
+def request_url(url:str, params) -> str:
+    if not isinstance(url, str):
+        raise TypeError(f"The 'url' parameter in request_url() should be of type <str>, passed: {type(url)}")
+    if params is not None and not isinstance(params, dict):
+        raise TypeError(f"The 'params' parameter in request_url() should be of type <dict> or None, passed: {type(params)}")
+
+    return requests.Request('GET', url, params=params).prepare().url
+
+"""
+Returns the raw bytes of the response to the request for 'url' (with query parameters 'params') cached in 'cache_dir' by an 
+earlier run, or None if the request has not been cached.
+"""
+def load_cached(url:str, params, cache_dir:str):
+    if not isinstance(url, str):
+        raise TypeError(f"The 'url' parameter in load_cached() should be of type <str>, passed: {type(url)}")
+    if params is not None and not isinstance(params, dict):
+        raise TypeError(f"The 'params' parameter in load_cached() should be of type <dict> or None, passed: {type(params)}")
+
+    try:
+        with gzip.open(cache_path(request_url(url, params), cache_dir), 'rb') as file:
+            return file.read()
+    except FileNotFoundError:
+        return None
+
+"""
+Stores the raw bytes 'content' of the response to the request for 'url' (with query parameters 'params') gzip-compressed in
+'cache_dir'. It is written to a temporary file and moved into place, so an interrupted run never leaves a partial entry behind. 
+Only call this for responses that should be reused by later runs, i.e. successful ones.
+"""
+def store_cached(url:str, params, cache_dir:str, content:bytes):
+    if not isinstance(url, str):
+        raise TypeError(f"The 'url' parameter in store_cached() should be of type <str>, passed: {type(url)}")
+    if params is not None and not isinstance(params, dict):
+        raise TypeError(f"The 'params' parameter in store_cached() should be of type <dict> or None, passed: {type(params)}")
+    if not isinstance(content, bytes):
+        raise TypeError(f"The 'content' parameter in store_cached() should be of type <bytes>, passed: {type(content)}")
+
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(gzip.compress(content, compresslevel=1))
+        os.replace(tmp_path, cache_path(request_url(url, params), cache_dir))
+    except BaseException:
+        os.remove(tmp_path)
+        raise
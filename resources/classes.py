@@ -7,3 +7,13 @@ class TimestampError(Exception):
     def __init__(self, message="The number of timestamps does not equal the number of measurements."):
         self.message = message
         super().__init__(self, message)
+
+"""
+Custom error class raised by the download functions when CHORDS rejects a request in a way that ends the run, e.g. denied access
+or an invalid instrument id. Carries the instrument id so that main() can report it once the other downloads are cancelled.
+"""
+class DownloadError(Exception):
+    def __init__(self, iD, message="The CHORDS portal rejected the data request."):
+        self.iD = iD
+        self.message = message
+        super().__init__(message)
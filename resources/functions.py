@@ -1,71 +1,82 @@
 import requests
-from json import dumps
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from json import loads
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta, time as dt_time
 import sys
-import math
-from .classes import TimestampError
+import os
+import csv
+import gzip
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from functools import lru_cache
+from .classes import TimestampError, DownloadError
+from .cache import load_cached, store_cached
+from . import _readme_payloads
+try:
+    import orjson
+except ImportError: # optional speedup -- parse_response() falls back to the stdlib parser
+    orjson = None
 
 # Functions -------------------------------------------------------------------------------------------------------------------------
 
+REQUEST_TIMEOUT = (5, 60) # (connect, read) timeouts in seconds for every CHORDS API call
+MAX_REQUEST_WORKERS = 16 # concurrent API requests to the CHORDS portal, across all instruments
+CSV_BUFFER_SIZE = 1 << 20 # 1 MiB write buffer for csv_builder()
+PRINT_LOCK = threading.Lock() # held for every progress or error message, so messages from the worker threads never interleave
+_WIND_DIR_SHORTNAMES = frozenset(('wd', 'wgd', 'wind_direction')) # as new shortnames get added to database, this must be updated
+_WIND_DIR_EDGES = np.array([22.5, 67.5, 112.5, 157.5, 202.5, 247.5, 292.5, 337.5]) # upper edge of each compass bin, in degrees
+_WIND_DIR_LABELS = np.array(['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW', 'N'])
+
 """
-Helper method for write_compass_direction().
-Takes the wind direction value in degrees and maps it to the compass reading. Returns the compass string.
+Creates the requests.Session used for every CHORDS API call. The pooled adapter keeps TCP/TLS connections alive between
+requests (sized for the concurrent instrument downloads in main()), retries transient gateway failures, and asks the 
+portal for gzip-compressed JSON, which requests decodes transparently.
 """
-def wind_direction_mapper(wind_dir:int, null_value) -> str:
-    if not isinstance(wind_dir, int):
-        raise TypeError(f"The 'wind_dir' parameter in wind_direction_mapper() should be of type <int>, passed: {type(wind_dir)}")
+def create_session(pool_size:int=16) -> requests.Session:
+    if not isinstance(pool_size, int):
+        raise TypeError(f"The 'pool_size' parameter in create_session() should be of type <int>, passed: {type(pool_size)}")
 
-    wind_dir_lookup = [
-        'N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW', 'N'
-    ]
-    wind_val_lookup = [
-        0, 22.5, 67.5, 112.5, 157.5, 202.5, 247.5, 292.4, 337.5, 360
-    ]
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, \
+                          max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504)))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({'Accept-Encoding': 'gzip', 'Connection': 'keep-alive'})
 
-    for i in range(len(wind_val_lookup)-1):
-        if wind_dir < 0 or wind_dir > 360:
-            return null_value
-        if wind_dir >= wind_val_lookup[i] and wind_dir <= wind_val_lookup[(i+1)]:
-            return wind_dir_lookup[i]   
-        
-    print(f"Error locating wind direction: {wind_dir}")    
-    sys.exit(1)
+    return session
 
 """
-Helper method for get_columns(), build_headers(), and write_compass_direction().
-Takes a shortname representing a measurement and returns True if that shortname is for wind direction, False otherwise.
+Parses the raw JSON body of a CHORDS API response and returns it as a dictionary. When orjson is installed it is used to parse 
+the bytes directly, which is several times faster than the stdlib parser on the float-heavy CHORDS payloads.
 """
-def is_wind_dir(measurement:str) -> bool:
-    if not isinstance(measurement, str):
-        raise TypeError(f"The 'measurement' parameter in is_wind_dir() should be of type <str>, passed: {type(measurement)}")
-    
-    wind_dir_shortnames = [ # as new shortnames get added to database, this must be updated
-        'wd', 'wgd', 'wind_direction'
-    ]
+def parse_response(content:bytes) -> dict:
+    if not isinstance(content, bytes):
+        raise TypeError(f"The 'content' parameter in parse_response() should be of type <bytes>, passed: {type(content)}")
 
-    if measurement in wind_dir_shortnames:
-        return True
+    if orjson is not None:
+        return orjson.loads(content)
 
-    return False
+    return loads(content)
 
 """
-Takes the dictionary entry of the measurements at a timestamp obtained from API. Adds the compass rose classification 
-for all measurements containing wind direction or wind gust direction to a new updated dictionary and returns it.
+Helper function for csv_builder().
+Takes a column of wind direction values in degrees and maps the whole column to compass readings at once, using a binary search
+over the compass bin edges. Values are truncated to whole degrees first. Values outside [0, 360], missing values (None), 
+and values that are not numeric map to the null value. Returns a np array of compass strings.
 """
-def write_compass_direction(dictionary:dict, null_value) -> dict:
-    if not isinstance(dictionary, dict):
-        raise TypeError(f"The 'dictionary' parameter in write_compass_direction() should be of type <dict>, passed: {type(dictionary)}")
+def compass_directions(wind_dirs:list, null_value) -> np.ndarray:
+    if not isinstance(wind_dirs, list):
+        raise TypeError(f"The 'wind_dirs' parameter in compass_directions() should be of type <list>, passed: {type(wind_dirs)}")
 
-    updated_dict = dictionary
-    for measurement in list(dictionary.keys()):
-        if is_wind_dir(measurement):
-            compass_dir = {f'{measurement}_compass_dir': wind_direction_mapper(int(dictionary[measurement]), null_value)}
-            updated_dict.update(compass_dir)  
+    degrees = np.trunc(pd.to_numeric(pd.Series(wind_dirs, dtype=object), errors='coerce').to_numpy(dtype=float))
+    compass = _WIND_DIR_LABELS[np.searchsorted(_WIND_DIR_EDGES, degrees, side='right')].astype(object)
+    compass[~((degrees >= 0) & (degrees <= 360))] = null_value # also catches NaN
 
-    return updated_dict
+    return compass
 
 """
 Helper function for build_headers() that checks if a header is in the known set of headers.
@@ -80,21 +91,70 @@ def headers_are_valid(columns_desired:list, columns_found:list, portal_name:str)
 
     for col in columns_desired:
         if col.endswith('compass_dir'):
-            print("\t ======================= ERROR =======================")
-            print("\t 'compass_dir' columns are not valid.")
-            print(f"\t Only specify shortnames found in {portal_name} associated with the instrument id.")
+            with PRINT_LOCK:
+                print("\t ======================= ERROR =======================")
+                print("\t 'compass_dir' columns are not valid.")
+                print(f"\t Only specify shortnames found in {portal_name} associated with the instrument id.")
             return False
         if col not in columns_found:
-            print("\t ======================= ERROR =======================")
-            print(f"\t Could not locate desired column '{col}' in data stream.")
             str_1 = ""
             for j in columns_found:
                 str_1 += f"{j}  "
-            print(f"\t Column(s) identified in data stream: {str_1}")
+            with PRINT_LOCK:
+                print("\t ======================= ERROR =======================")
+                print(f"\t Could not locate desired column '{col}' in data stream.")
+                print(f"\t Column(s) identified in data stream: {str_1}")
             return False
         
     return True
 
+_BARBADOS_SORT = [ # Barbados
+    't1', 't2', 't3', 'rh1', 'msl1', 'sp1', 'ws', 'wd', 'rain', 'vis1', 'ir1', 'uv1'
+]
+_TRINIDAD_SORT = [ # Trinidad
+    'bt1', 'mt1', 'ht1', 'bp1', 'bh1', 'hh1', 'ws', 'wd', 'wg', 'wgd', 'rg', 'sv1', 'si1', 'su1', 'bcs', 'bpc', 'cfr', 'css'
+]
+_THREED_SORT = [ # 3D PAWS
+    't1', 't2', 't3', 'ht1', 'ht2', 'bt1', 'mt1', 'st1', 'htu21d_temp', 'mcp9808', 'bmp_temp', 'bme_temp', 
+    'bp1', 'sp1', 'msl1', 'bmp_slp', 'bme_slp', 'bmp_pressure', 'bme_pressure', 
+    'bmp_altitude',
+    'ws', 'wind_speed', 'wd', 'wind_direction', 'wg', 'wgd',
+    'hh1', 'hh2', 'rh1', 'bh1', 'sh1', 'htu21d_humidity', 'bme_humidity',
+    'rain', 'rg', 'rgt', 'rgp', 'rgds',
+    'h1', 'wlo', 'wld', 'wlm', 'wlr', # water level sensors
+    'sg', # snow depth sensor
+    'st1', 'st2', 'st3', 'sm1', 'sm2', 'sm3', # soil temp and soil moisture sensors
+    'sv1', 'si1', 'su1', 'vis1', 'ir1', 'uv1', 'si1145_vis', 'si1145_ir', 'si1145_uv', 'si1145_vis1', 'si1145_ir1', 'si1145_uv1',
+        'si1145_vis2', 'si1145_ir2', 'si1145_uv2', 'si1145_vis3', 'si1145_ir3', 'si1145_uv3', 'si1145_vis4', 'si1145_ir4', 'si1145_uv4',
+        'solar1', 'solar2', 'lx', # irradiance sensors
+    'bcs', 'bpc', 'cfr', 'bv', 'css', 'hth' # battery health
+
+]
+_THREED_CAL_SORT = [ # 3D Calibration
+    'htu21d_temp', 'bmp_temp', 'mcp9808', 'sht31d_temp', 'sht31d_humidity', 'htu21d_humidity', 'bmp_slp', 'bmp_pressure', 'rain', 'wind_speed', 
+    'wind_direction', 'wg', 'wgd', 'si1145_vis', 'si1145_ir', 'si1145_uv', 'bpc'
+]
+_FEWSNET_SORT = [ # FEWSNET
+    'rg1', 'rg2', 'rgt1', 'rgt2', 'rgp1', 'rgp2',
+    'hi',  'wbt', 'wbgt',
+    'bt1', 'bt2', 'ht1', 'ht2', 'st1', 'mt1',
+    'bh1', 'bh2', 'hh1', 'hh2', 'sh1',
+    'bp1', 'bp2',
+    'hth', 'bpc', 'bcs', 'css', 'cfr'
+]
+_DOMINICAN_SORT = [ # Dominican Republic
+    'ht1', 'bt1', 'mt1', 'hh1', 'bmp_slp', 'bp1', 'rg', 'ws', 'wd', 'wg', 'wgd', 'sv1', 'si1', 'su1', 'hth', 'bpc'
+]
+
+_PORTAL_SORT_MAPS = { # built once at import, portal name -> {column: position}
+    'Barbados': {col: i for i, col in enumerate(_BARBADOS_SORT)},
+    'Trinidad': {col: i for i, col in enumerate(_TRINIDAD_SORT)},
+    '3D PAWS': {col: i for i, col in enumerate(_THREED_SORT)},
+    '3D Calibration': {col: i for i, col in enumerate(_THREED_CAL_SORT)},
+    'FEWSNET': {col: i for i, col in enumerate(_FEWSNET_SORT)},
+    'Dominican Republic': {col: i for i, col in enumerate(_DOMINICAN_SORT)},
+}
+
 """
 Helper function for get_columns that applies a kind of sort to the headers. Data from API stream comes into main() via
 Python dictionaries, which randomly store key/value pairs, and so the column headers will be randomly ordered without sort.
@@ -106,62 +166,23 @@ def sort_columns(columns:list, portal_name:str) -> list:
     if not isinstance(portal_name, str):
         raise TypeError(f"The 'portal_name' parameter in sort_columns() should be of type <str>, passed: {type(portal_name)}")
 
-    b_sort = [ # Barbados
-        't1', 't2', 't3', 'rh1', 'msl1', 'sp1', 'ws', 'wd', 'rain', 'vis1', 'ir1', 'uv1'
-    ]
-    t_sort = [ # Trinidad
-        'bt1', 'mt1', 'ht1', 'bp1', 'bh1', 'hh1', 'ws', 'wd', 'wg', 'wgd', 'rg', 'sv1', 'si1', 'su1', 'bcs', 'bpc', 'cfr', 'css'
-    ]
-    threeD_sort = [ # 3D PAWS
-        't1', 't2', 't3', 'ht1', 'ht2', 'bt1', 'mt1', 'st1', 'htu21d_temp', 'mcp9808', 'bmp_temp', 'bme_temp', 
-        'bp1', 'sp1', 'msl1', 'bmp_slp', 'bme_slp', 'bmp_pressure', 'bme_pressure', 
-        'bmp_altitude',
-        'ws', 'wind_speed', 'wd', 'wind_direction', 'wg', 'wgd',
-        'hh1', 'hh2', 'rh1', 'bh1', 'sh1', 'htu21d_humidity', 'bme_humidity',
-        'rain', 'rg', 'rgt', 'rgp', 'rgds',
-        'h1', 'wlo', 'wld', 'wlm', 'wlr', # water level sensors
-        'sg', # snow depth sensor
-        'st1', 'st2', 'st3', 'sm1', 'sm2', 'sm3', # soil temp and soil moisture sensors
-        'sv1', 'si1', 'su1', 'vis1', 'ir1', 'uv1', 'si1145_vis', 'si1145_ir', 'si1145_uv', 'si1145_vis1', 'si1145_ir1', 'si1145_uv1',
-            'si1145_vis2', 'si1145_ir2', 'si1145_uv2', 'si1145_vis3', 'si1145_ir3', 'si1145_uv3', 'si1145_vis4', 'si1145_ir4', 'si1145_uv4',
-            'solar1', 'solar2', 'lx', # irradiance sensors
-        'bcs', 'bpc', 'cfr', 'bv', 'css', 'hth' # battery health
-
-    ]
-    threeD_cal_sort = [ # 3D Calibration
-        'htu21d_temp', 'bmp_temp', 'mcp9808', 'sht31d_temp', 'sht31d_humidity', 'htu21d_humidity', 'bmp_slp', 'bmp_pressure', 'rain', 'wind_speed', 
-        'wind_direction', 'wg', 'wgd', 'si1145_vis', 'si1145_ir', 'si1145_uv', 'bpc'
-    ]
-    f_sort = [ # FEWSNET
-        'rg1', 'rg2', 'rgt1', 'rgt2', 'rgp1', 'rgp2',
-        'hi',  'wbt', 'wbgt',
-        'bt1', 'bt2', 'ht1', 'ht2', 'st1', 'mt1',
-        'bh1', 'bh2', 'hh1', 'hh2', 'sh1',
-        'bp1', 'bp2',
-        'hth', 'bpc', 'bcs', 'css', 'cfr'
-    ]
-    d_sort = [ # Dominican Republic
-        'ht1', 'bt1', 'mt1', 'hh1', 'bmp_slp', 'bp1', 'rg', 'ws', 'wd', 'wg', 'wgd', 'sv1', 'si1', 'su1', 'hth', 'bpc'
-    ]
-
-    if portal_name == "Barbados":
-        column_map = {col: i for i, col in enumerate(b_sort)}
-    elif portal_name == "Trinidad":
-        column_map = {col: i for i, col in enumerate(t_sort)}
-    elif portal_name == "3D PAWS":
-        column_map = {col: i for i, col in enumerate(threeD_sort)}
-    elif portal_name == "3D Calibration":
-        column_map = {col: i for i, col in enumerate(threeD_cal_sort)}
-    elif portal_name == "FEWSNET":
-        column_map = {col: i for i, col in enumerate(f_sort)}
-    elif portal_name == "Dominican Republic":
-        column_map = {col: i for i, col in enumerate(d_sort)}
-    else:
-        print("Could not sort columns.")
+    return list(_sort_columns_cached(tuple(columns), portal_name))
+
+"""
+Helper function for sort_columns() that does the actual sort. Memoized on the (columns, portal) pair, because every instrument 
+on a portal reports the same few key sets, so each distinct key set only has to be sorted once per run. Returns a tuple so the 
+cached result can't be modified by a caller.
+"""
+@lru_cache(maxsize=None)
+def _sort_columns_cached(columns:tuple, portal_name:str) -> tuple:
+    column_map = _PORTAL_SORT_MAPS.get(portal_name)
+    if column_map is None:
+        with PRINT_LOCK:
+            print("Could not sort columns.")
         sys.exit(1) 
 
     sorted_columns = sorted(columns, key=lambda col: column_map.get(col, float('inf'))) # columns not found in sort appended at end
-    return list(sorted_columns) 
+    return tuple(sorted_columns) 
 
 """
 Takes a list of dictionaries and returns a list of the set of all variables to be used as columns in the csv.
@@ -178,11 +199,20 @@ def get_columns(dictionary_list:list, include_test:bool, portal_name:str) -> lis
         raise TypeError(f"The 'portal_name' parameter in get_columns() should be of type <str>, passed: {type(portal_name)}")
 
     columns = [] # list of strings 
+    seen_columns = set() # hashed membership, the 'columns' list itself is only kept for its order
+    seen_keysets = set() # an instrument's stream usually repeats one set of keys, so only a new key set can add columns
     for dictionary in dictionary_list:
-        cols = list(dictionary.keys())
+        keyset = frozenset(dictionary)
+        if keyset in seen_keysets:
+            continue
+        seen_keysets.add(keyset)
+
+        cols = list(dictionary)
+        cols.extend([f'{col}_compass_dir' for col in dictionary if col in _WIND_DIR_SHORTNAMES]) # filled in by csv_builder()
         cols_sorted = sort_columns(cols, portal_name)
         for col in cols_sorted:
-            if not col in columns:
+            if col not in seen_columns:
+                seen_columns.add(col)
                 columns.append(str(col))
                 if include_test:
                     columns.append('test')
@@ -210,29 +240,48 @@ def build_headers(measurements:list, columns_desired:list, include_test:bool, po
     if not headers_are_valid(columns_desired, columns, portal_name): # check if user typed in recognized shortnames
         sys.exit(1)
     
-    for i in range(len(columns)):
-        if len(columns_desired) == 0: # no user-specified columns
-            headers.append(columns[i])
-        elif len(columns_desired) != 0 and columns[i] in columns_desired:
-            headers.append(columns[i])
-            if include_test:
+    if len(columns_desired) == 0: # no user-specified columns
+        headers.extend(columns)
+        return headers
+
+    desired = set(columns_desired)
+    for i, col in enumerate(columns):
+        if col in desired:
+            headers.append(col)
+            if include_test and i+1 < len(columns): # get_columns() puts a 'test' column after each column
                 headers.append(columns[i+1])
-            if is_wind_dir(columns[i]):
-                headers.append(f'{columns[i]}_compass_dir')
-        elif len(columns_desired) != 0 and columns[i] not in columns_desired:
-            continue  
-        else:
-            print("Error locating column header names.")
-            sys.exit(1)
+            if col in _WIND_DIR_SHORTNAMES:
+                headers.append(f'{col}_compass_dir')
 
     return headers
 
+"""
+Helper function for csv_builder() that returns a function pulling the values of 'fields' out of a measurement dictionary, in order,
+as a tuple. The lookup is a single C-level operator.itemgetter() call specialized to the instrument's columns, and raises KeyError 
+if one of the fields is missing from the dictionary.
+"""
+def field_getter(fields:list):
+    if not isinstance(fields, list):
+        raise TypeError(f"The 'fields' parameter in field_getter() should be of type <list>, passed: {type(fields)}")
+
+    if not fields: # itemgetter() needs at least one key, e.g. when the instrument has no measurement columns
+        return lambda dictionary: ()
+    if len(fields) == 1: # itemgetter() of a single key returns the bare value rather than a tuple
+        get_field = itemgetter(fields[0])
+        return lambda dictionary: (get_field(dictionary),)
+
+    return itemgetter(*fields)
+
 """
 Accepts an array of headers, timestamps, and of dictionaries containing sensor measurements. 
 Also accepts a np array of whether or not  the measurements at that timestamp are test values. 
-Accepts a string of the filepath at which to create the csv file and creates the csv there.
+Accepts a string of the filepath at which to create the csv file and streams the csv there row-by-row, so no second copy of
+the data is built in memory. The file uses a large write buffer that is only flushed when it fills or the file closes.
+If compress is True the csv is gzip-compressed at the fastest level and written to filepath + '.gz' instead.
+The '<shortname>_compass_dir' columns are not stored in the measurement dictionaries, they are computed here for the whole column.
 """
-def csv_builder(headers:list, time:np.ndarray, measurements:np.ndarray, test:np.ndarray, filepath:str, include_test:bool, null_value): 
+def csv_builder(headers:list, time:np.ndarray, measurements:np.ndarray, test:np.ndarray, filepath:str, include_test:bool, null_value, \
+                                                                                                            compress:bool=False): 
     if not isinstance(headers, list):
         raise TypeError(f"The 'headers' parameter in csv_builder() should be of type <list>, passed: {type(headers)}")
     if not isinstance(time, np.ndarray):
@@ -245,18 +294,55 @@ def csv_builder(headers:list, time:np.ndarray, measurements:np.ndarray, test:np.
         raise TypeError(f"The 'filepath' parameter in csv_builder() should be of type <str>, passed: {type(filepath)}")
     if not isinstance(include_test, bool):
         raise TypeError(f"The 'include_test' parameter in csv_builder() should be of type <bool>, passed: {type(include_test)}")
+    if not isinstance(compress, bool):
+        raise TypeError(f"The 'compress' parameter in csv_builder() should be of type <bool>, passed: {type(compress)}")
 
     if len(time) == len(measurements):
-        data = [] # list of timestamps, measurements, test val's, and headers (to turn into dataframe)
-        for i in range(len(time)):
-            measurements[i].update({'time':time[i]}) 
-            if include_test and len(test) == len(time):
-                measurements[i].update({'test':test[i]})
-            measurement_dict = {header: measurements[i].get(header, null_value) for header in headers} # fill in null value for var's with no data
-            data.append(measurement_dict)
-        
-        df = pd.DataFrame(data, columns=headers)
-        df.to_csv(filepath, index=False)
+        use_test = include_test and len(test) == len(time)
+
+        sources = [] # per header, either the measurement field it is read from or the whole column of values
+        for header in headers:
+            if header == 'time':
+                sources.append(time)
+            elif header == 'test' and use_test:
+                sources.append(test)
+            elif header.endswith('_compass_dir') and header[:-len('_compass_dir')] in _WIND_DIR_SHORTNAMES:
+                wind_dirs = [dictionary.get(header[:-len('_compass_dir')]) for dictionary in measurements]
+                sources.append(compass_directions(wind_dirs, null_value)) # one vectorized pass per wind direction column
+            else:
+                sources.append(header)
+
+        # each row is assembled as (measurement dict, *column values, *field values) and then put into header order
+        fields = [source for source in sources if isinstance(source, str)]
+        columns = [source for source in sources if not isinstance(source, str)]
+        order = []
+        next_column, next_field = 1, 1 + len(columns)
+        for source in sources:
+            if isinstance(source, str):
+                order.append(next_field)
+                next_field += 1
+            else:
+                order.append(next_column)
+                next_column += 1
+        get_fields = field_getter(fields)
+        arrange = field_getter(order)
+
+        def rows():
+            for values in zip(measurements, *columns):
+                try:
+                    yield arrange(values + get_fields(values[0]))
+                except KeyError: # a sensor did not report at this timestamp, fill in null value for var's with no data
+                    yield arrange(values + tuple([values[0].get(field, null_value) for field in fields]))
+
+        if compress: # level 1 keeps compression from becoming the bottleneck, CHORDS csv's still shrink ~8x
+            file = gzip.open(filepath + '.gz', 'wt', compresslevel=1, newline='', encoding='utf-8')
+        else:
+            file = open(filepath, 'w', buffering=CSV_BUFFER_SIZE, newline='', encoding='utf-8')
+
+        with file:
+            writer = csv.writer(file, lineterminator=os.linesep)
+            writer.writerow(headers)
+            writer.writerows(rows()) # the write loop and field formatting run inside the C csv module
     else:
         raise TimestampError()
     
@@ -269,11 +355,7 @@ def has_excess_datapoints(dictionary:dict) -> bool:
     if not isinstance(dictionary, dict):
         raise TypeError(f"The 'dictionary' parameter in stream_has_data() should be of type <dict>, passed: {type(dictionary)}")
 
-    for key in dictionary: 
-        if key == "errors":
-            return True
-
-    return False
+    return "errors" in dictionary
 
 """
 Accepts np arrays for measurements, time, and test which were created from the data stream from CHORDS, and checks whether 
@@ -292,7 +374,8 @@ def struct_has_data(measurements:np.ndarray, time:np.ndarray, test:np.ndarray) -
         #print("\t\t No measurements found.")
         flag = False
     if len(time) == 0:
-        print("\t\t No timestamps found.\n")
+        with PRINT_LOCK:
+            print("\t\t No timestamps found.\n")
         flag = False
     if len(test) == 0:
         #print("\t\t No test values found.")
@@ -302,161 +385,134 @@ def struct_has_data(measurements:np.ndarray, time:np.ndarray, test:np.ndarray) -
 
 
 """
-Accepts the resulting data stream of API request, and checks if any of the keys are a known error. Prints are more useful error
-message to the screen for troubleshooting. Returns True if error is found, False otherwise.
+Accepts the resulting data stream of API request for instrument 'iD', and checks if any of the keys are a known error. Raises a 
+DownloadError with a more useful error message for troubleshooting if one is found. It is raised rather than exiting, since this
+runs on a worker thread of the pool in main().
 ** when the API returns 'errors' key, the information is stored in a list  **
 ** when the API returns 'error' key, the information is stored in a string **
 """
-def has_errors(all_fields:dict) -> bool:
+def check_errors(all_fields:dict, iD:int):
     if not isinstance(all_fields, dict):
-        raise TypeError(f"The 'all_fields' parameter in has_errors() should be of type <dict>, passed: {type(all_fields)}")
-
-    for key in all_fields:
-        if key == 'errors' and all_fields['errors'][0] == 'Access Denied, user authentication required.': 
-            print(all_fields[key][0])
-            print("Check url, email address, and api key.")
-            return True
-        if key == 'error' and all_fields['error'] == 'Internal Server Error':
-            print(all_fields[key])
-            print("Check to make sure the instrument ID's are valid. Refer to the CHORDS Portal.")
-            return True
-                
-    return False
-
-"""
-Handles specific time window requested by user. Stores only data that falls into the time window specified and returns data from API pull as a list of lists.
-
-TO DO: Increase efficiency. Currently steps through day-by-day, will take forever for large amounts of data.
-"""
-def time_window(iD:int, timestamp_start:datetime, timestamp_end:datetime, timestamp_window_start:dt_time, \
-                                timestamp_window_end:dt_time, portal_url:str, user_email:str, api_key:str, null_value) -> list:
+        raise TypeError(f"The 'all_fields' parameter in check_errors() should be of type <dict>, passed: {type(all_fields)}")
+    if not isinstance(iD, int):
+        raise TypeError(f"The 'iD' parameter in check_errors() should be of type <int>, passed: {type(iD)}")
+
+    errors = all_fields.get('errors')
+    if errors and errors[0] == 'Access Denied, user authentication required.': 
+        raise DownloadError(iD, f"{errors[0]}\nCheck url, email address, and api key.")
+    if all_fields.get('error') == 'Internal Server Error':
+        raise DownloadError(iD, f"{all_fields['error']}\nCheck to make sure the instrument ID's are valid. Refer to the CHORDS Portal.")
+
+"""
+Runs a single CHORDS data API request for instrument 'iD' over the time frame given and returns the parsed response as a dictionary.
+Every data request goes through here. If 'cache_dir' is specified a response cached by an earlier run is used instead of 
+contacting the portal, and a new response is cached. Only successful responses holding data are cached -- an error reply,
+such as too many datapoints or denied access, must be seen by the next run too, so it is never stored (or used, if an older
+version of this code stored it). Time frames that ended less than a day ago bypass the cache, since recent data may still be 
+arriving at the portal.
+"""
+def query_data(session:requests.Session, iD:int, timestamp_start:datetime, timestamp_end:datetime, \
+                                                        portal_url:str, user_email:str, api_key:str, cache_dir=None) -> dict:
+    if not isinstance(session, requests.Session):
+        raise TypeError(f"The 'session' parameter in query_data() should be of type <requests.Session>, passed: {type(session)}")
     if not isinstance(iD, int):
-        raise TypeError(f"The 'iD' parameter in time_window() should be of type <int>, passed: {type(iD)}")
+        raise TypeError(f"The 'iD' parameter in query_data() should be of type <int>, passed: {type(iD)}")
     if not isinstance(timestamp_start, datetime):
-        raise TypeError(f"The 'timestamp_start' parameter in time_window() should be of type <datetime>, passed: {type(timestamp_start)}")
+        raise TypeError(f"The 'timestamp_start' parameter in query_data() should be of type <datetime>, passed: {type(timestamp_start)}")
     if not isinstance(timestamp_end, datetime):
-        raise TypeError(f"The 'timestamp_end' parameter in time_window() should be of type <datetime>, passed: {type(timestamp_end)}")
-    if not isinstance(timestamp_window_start, dt_time):
-        raise TypeError(f"The 'timestamp_window_start' parameter in time_window() should be of type <datetime.time>, passed: {type(timestamp_window_start)}")
-    if not isinstance(timestamp_window_end, dt_time):
-        raise TypeError(f"The 'timestamp_window_end' parameter in time_window() should be of type <datetime.time>, passed: {type(timestamp_window_end)}")
-    if not isinstance(portal_url, str):
-        raise TypeError(f"The 'portal_url' parameter in time_window() should be of type <str>, passed: {type(portal_url)}")
-    if not isinstance(user_email, str):
-        raise TypeError(f"The 'user_email' parameter in time_window() should be of type <str>, passed: {type(user_email)}")
-    if not isinstance(api_key, str):
-        raise TypeError(f"The 'api_key' parameter in time_window() should be of type <str>, passed: {type(api_key)}")
+        raise TypeError(f"The 'timestamp_end' parameter in query_data() should be of type <datetime>, passed: {type(timestamp_end)}")
 
-    time = []
-    measurements = []
-    test = []
-    total_num_measurements = 0
-
-    date_start = timestamp_start.date()
-    if datetime.combine(date_start, timestamp_window_start) >= timestamp_start: 
-        time_window_begin = datetime.combine(date_start, timestamp_window_start)
-        time_window_stop = datetime.combine(date_start, timestamp_window_end)
-
-        url = f"{portal_url}/api/v1/data/{iD}?start={time_window_begin}&end={time_window_stop}&email={user_email}&api_key={api_key}"
-        response = requests.get(url=url)
-        all_fields = loads(dumps(response.json()))
+    if timestamp_end > datetime.now() - timedelta(days=1):
+        cache_dir = None
 
-        if has_errors(all_fields):
-                sys.exit(1)
+    url = f"{portal_url}/api/v1/data/{iD}"
+    params = {'start': timestamp_start, 'end': timestamp_end, 'email': user_email, 'api_key': api_key}
+    if cache_dir is not None:
+        content = load_cached(url, params, cache_dir)
+        if content is not None:
+            all_fields = parse_response(content)
+            if 'errors' not in all_fields and 'error' not in all_fields:
+                return all_fields
 
-        data = all_fields['features'][0]['properties']['data']
-        for dictionary in data:
-                time.append(str(dictionary['time']))
-                total_num_measurements += len(dictionary['measurements'].keys())
-                to_append = write_compass_direction(dict(dictionary['measurements']), null_value)
-                measurements.append(to_append)
-                test.append(str(dictionary['test']))
+    response = session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+    all_fields = parse_response(response.content)
+    if cache_dir is not None and response.ok and 'errors' not in all_fields and 'error' not in all_fields:
+        store_cached(url, params, cache_dir, response.content)
 
-    i = 0 
-    next_date = date_start + timedelta(days=1)
-    while datetime.combine(next_date, timestamp_window_end) < timestamp_end:
-        time_window_begin = datetime.combine(next_date, timestamp_window_start)
-        time_window_stop = datetime.combine(next_date, timestamp_window_end)
-
-        url = f"{portal_url}/api/v1/data/{iD}?start={time_window_begin}&end={time_window_stop}&email={user_email}&api_key={api_key}"
-        response = requests.get(url=url)
-        all_fields = loads(dumps(response.json()))
-
-        if has_errors(all_fields):
-            sys.exit(1)
+    return all_fields
 
-        data = all_fields['features'][0]['properties']['data']
-        for dictionary in data:
-                time.append(str(dictionary['time']))
-                total_num_measurements += len(dictionary['measurements'].keys())
-                to_append = write_compass_direction(dict(dictionary['measurements']), null_value)
-                measurements.append(to_append)
-                test.append(str(dictionary['test']))
-
-        next_date = next_date + timedelta(days=1)
+"""
+Takes the list of datapoints from a CHORDS API response and returns the data as a list [time, measurements, test, total_num_measurements].
+    e.g. [{'time': '2023-12-17T18:45:56Z', 'test': 'false', 'measurements': {'ws': 1.55, 'rain': 1}}, ...]
+Each column is pulled out with its own list comprehension, which is cheaper than building a DataFrame just to split it up.
+"""
+def unpack_data(data:list) -> list:
+    if not isinstance(data, list):
+        raise TypeError(f"The 'data' parameter in unpack_data() should be of type <list>, passed: {type(data)}")
 
-        i += 1
-        if i == 100:
-            print("\t\t Large data request.")
-            print("\t\t\t Getting next data segment...")
-        elif i%100 == 0:
-            print("\t\t\t Getting next data segment...")
+    time = [datapoint['time'] for datapoint in data] # already strings in the JSON, no coercion needed
+    test = [datapoint['test'] for datapoint in data]
+    if all(isinstance(value, bool) for value in test): # keep CHORDS' own 'true'/'false' spelling rather than str()'s 'True'/'False'
+        test = ['true' if value else 'false' for value in test]
+    measurements = [datapoint['measurements'] for datapoint in data] # parser dicts are used as-is, not copied
+    total_num_measurements = sum(map(len, measurements))
 
     return [time, measurements, test, total_num_measurements]
 
-
 """
-Helper function for reduce_datapoints() that breaks up large time frames into smaller benchmark timestamps.
-Returns a list of all the timestamps to use in order to shrink data points returned by API.
+Runs the API request for one day's time window (see window_range()) and returns the data as a list 
+[time, measurements, test, total_num_measurements]. If 'cache_dir' is specified, the response is cached there (see query_data()).
 """
-def get_timestamps(start_time:datetime, end_time:datetime, divisions:int) -> list:
-    if not isinstance(start_time, datetime):
-        raise TypeError(f"The 'start_time' parameter in get_timestamps() should be of type <datetime>, passed: {type(start_time)}")
-    if not isinstance(end_time, datetime):
-        raise TypeError(f"The 'end_time' parameter in get_timestamps() should be of type <datetime>, passed: {type(end_time)}")
-    if not isinstance(divisions, int):
-        raise TypeError(f"The 'divisions' parameter in get_timestamps() should be of type <int>, passed: {type(divisions)}")
-    
-    time_delta = math.floor(( (end_time - start_time).total_seconds() / 60 ) / divisions) # in minutes rounded down
-    begin = start_time
-    new_timestamps = []
-    new_timestamps.append(start_time)
-
-    i = 1
-    while i <= divisions:
-        new_timestamp = begin + timedelta(minutes=time_delta)
-        new_timestamps.append(new_timestamp)
-        begin = new_timestamp
-        i += 1
-    
-    if begin != end_time:
-        time_till_end = math.ceil(( (end_time- new_timestamps[len(new_timestamps)-1]).total_seconds() / 60 ) / divisions) # in minutes rounded up
-        if time_till_end < time_delta:
-            new_timestamps.append(end_time)
-        else:
-            print("Timestamp reduction error -- Check API request for incorrect input.")
-            sys.exit(1)
+def fetch_window(session:requests.Session, iD:int, time_window_begin:datetime, time_window_stop:datetime, \
+                                                        portal_url:str, user_email:str, api_key:str, cache_dir=None) -> list:
+    if not isinstance(session, requests.Session):
+        raise TypeError(f"The 'session' parameter in fetch_window() should be of type <requests.Session>, passed: {type(session)}")
+    if not isinstance(time_window_begin, datetime):
+        raise TypeError(f"The 'time_window_begin' parameter in fetch_window() should be of type <datetime>, passed: {type(time_window_begin)}")
+    if not isinstance(time_window_stop, datetime):
+        raise TypeError(f"The 'time_window_stop' parameter in fetch_window() should be of type <datetime>, passed: {type(time_window_stop)}")
 
-    return new_timestamps
+    all_fields = query_data(session, iD, time_window_begin, time_window_stop, portal_url, user_email, api_key, cache_dir)
+    check_errors(all_fields, iD)
+
+    return unpack_data(all_fields['features'][0]['properties']['data'])
 
 """
-Accepts a timestamp string from the CHORDS API and parses out the timestamp. Returns a datetime object of the parameter.
-    e.g.  '2023-12-17T18:45:56Z'
+Handles specific time window requested by user. Returns the (begin, stop) datetime tuples of the window on every day of the 
+requested time frame, in time order, so that main() can request each day with fetch_window() on its pool.
 """
-def get_time(timestamp:str) -> datetime:
-    if not isinstance(timestamp, str):
-        raise TypeError(f"The 'timestamp' parameter in get_time() should be of type <str>, passed: {type(timestamp)}")
-    
-    format_str = "%H:%M:%S" 
-    return datetime.strptime(timestamp[11:19], format_str)
+def window_range(timestamp_start:datetime, timestamp_end:datetime, timestamp_window_start:dt_time, timestamp_window_end:dt_time) -> list:
+    if not isinstance(timestamp_start, datetime):
+        raise TypeError(f"The 'timestamp_start' parameter in window_range() should be of type <datetime>, passed: {type(timestamp_start)}")
+    if not isinstance(timestamp_end, datetime):
+        raise TypeError(f"The 'timestamp_end' parameter in window_range() should be of type <datetime>, passed: {type(timestamp_end)}")
+    if not isinstance(timestamp_window_start, dt_time):
+        raise TypeError(f"The 'timestamp_window_start' parameter in window_range() should be of type <datetime.time>, passed: {type(timestamp_window_start)}")
+    if not isinstance(timestamp_window_end, dt_time):
+        raise TypeError(f"The 'timestamp_window_end' parameter in window_range() should be of type <datetime.time>, passed: {type(timestamp_window_end)}")
+
+    windows = []
+    date_start = timestamp_start.date()
+    if datetime.combine(date_start, timestamp_window_start) >= timestamp_start: 
+        windows.append((datetime.combine(date_start, timestamp_window_start), datetime.combine(date_start, timestamp_window_end)))
+
+    next_date = date_start + timedelta(days=1)
+    while datetime.combine(next_date, timestamp_window_end) < timestamp_end:
+        windows.append((datetime.combine(next_date, timestamp_window_start), datetime.combine(next_date, timestamp_window_end)))
+        next_date = next_date + timedelta(days=1)
+
+    return windows
+
 
 """
-Handles data request error where number of data points exceeds that allowed. Returns a list of new timestamps for which 
-to run the API request to CHORDS s.t. the number of data points requested is less than the max allowed. Returns the 
-lists of data necessary for main() to build csv's.
+Handles data request error where number of data points exceeds that allowed. Splits the time frame in half, and keeps 
+splitting only the halves that still exceed the max allowed, until every segment can be requested from CHORDS whole. Returns the 
+lists of data necessary for main() to build csv's. Each segment request goes through the cache in 'cache_dir', if specified.
 """
-def reduce_datapoints(error_message:str, iD:int, timestamp_start:datetime, timestamp_end:datetime, \
-                                                        portal_url:str, user_email:str, api_key:str, null_value) -> list:
+def reduce_datapoints(session:requests.Session, error_message:str, iD:int, timestamp_start:datetime, timestamp_end:datetime, \
+                                                        portal_url:str, user_email:str, api_key:str, cache_dir=None) -> list:
+    if not isinstance(session, requests.Session):
+        raise TypeError(f"The 'session' parameter in reduce_datapoints() should be of type <requests.Session>, passed: {type(session)}")
     if not isinstance(error_message, str):
         raise TypeError(f"The 'error_message' parameter in reduce_datapoints() should be of type <str>, passed: {type(error_message)}")
     if not isinstance(iD, int):
@@ -473,309 +529,273 @@ def reduce_datapoints(error_message:str, iD:int, timestamp_start:datetime, times
         raise TypeError(f"The 'api_key' parameter in reduce_datapoints() should be of type <str>, passed: {type(api_key)}")
 
 
-    print("\t Beginning reduction calculation.")
+    with PRINT_LOCK:
+        print(f"\t Beginning reduction calculation for instrument ID {iD}.")
+
+    def fetch_segment(segment:tuple) -> dict:
+        with PRINT_LOCK:
+            print(f"\t\t Getting next data segment for instrument ID {iD}...")
+        return query_data(session, iD, segment[0], segment[1], portal_url, user_email, api_key, cache_dir)
+
+    # only the segments that still return too many datapoints are split in half. They are requested one at a time: this runs 
+    # on a worker of the pool in main(), which already bounds the requests in flight to the portal
+    segments_done = [] # (segment start, data) of every segment that came back whole
+    segments = [(timestamp_start, timestamp_end)]
+    while segments:
+        segment = segments.pop()
+        all_fields = fetch_segment(segment)
+        check_errors(all_fields, iD)
+        if not has_excess_datapoints(all_fields):
+            segments_done.append((segment[0], all_fields['features'][0]['properties']['data']))
+            continue
+
+        half = (segment[1] - segment[0]) // 2
+        if half < timedelta(seconds=1):
+            raise DownloadError(iD, "Timestamp reduction error -- Check API request for incorrect input.")
+        middle = segment[0] + timedelta(seconds=int(half.total_seconds())) # whole seconds, like CHORDS timestamps
+        segments.extend([(segment[0], middle), (middle + timedelta(seconds=1), segment[1])]) # no datapoint in both
 
     time = [] # to avoid a duplicate API cycle in main() -- save time
     measurements = []
     test = []
     total_num_measurements = 0
-    
-    num_divisions = 2
-    new_timestamps = get_timestamps(timestamp_start, timestamp_end, num_divisions)
-    t = new_timestamps[0] # to store progress
-    
-    keep_going = True
-    excess_flag = False 
-    while keep_going:
-        for i in range(len(new_timestamps)-1):
-            if new_timestamps[i] < t and t != new_timestamps[0]: # skip timestamps already shown to pass 
-                continue
-
-            print("\t\t Getting next data segment...")
-            url = f"{portal_url}/api/v1/data/{iD}?start={new_timestamps[i]}&end={new_timestamps[i+1]}&email={user_email}&api_key={api_key}"
-            response = requests.get(url=url)
-            all_fields = loads(dumps(response.json()))
-
-            if has_excess_datapoints(all_fields):
-                t = new_timestamps[i]
-                num_divisions *= 2
-                new_timestamps = get_timestamps(timestamp_start, timestamp_end, num_divisions)
-                excess_flag = True
-                break
-            
-            excess_flag = False
-
-            data = all_fields['features'][0]['properties']['data']
-            for dictionary in data:
-                time.append(str(dictionary['time']))
-                total_num_measurements += len(dictionary['measurements'].keys())
-                to_append = write_compass_direction(dict(dictionary['measurements']), null_value)
-                measurements.append(to_append)
-                test.append(str(dictionary['test']))
-            
-        if not excess_flag:
-            keep_going = False    
+
+    segments_done.sort(key=lambda segment: segment[0]) # segments never overlap, so this puts the data back in time order
+    for _, data in segments_done:
+        segment_data = unpack_data(data)
+        time.extend(segment_data[0])
+        measurements.extend(segment_data[1])
+        test.extend(segment_data[2])
+        total_num_measurements += segment_data[3]
         
-    print("\t Finished reduction calculation.")
+    with PRINT_LOCK:
+        print(f"\t Finished reduction calculation for instrument ID {iD}.")
     return [time, measurements, test, total_num_measurements]
 
 
 """
-Accepts the CHORDS portal name specified by user and creates the correct README associated with that portal.
+Splits the requested time frame into consecutive windows of at most 'days' days, which main() requests with fetch_range().
+Each window ends one second before the next begins (CHORDS timestamps have second resolution), so no datapoint is returned 
+by two windows. Returns a list of (start, end) datetime tuples.
+"""
+def shard_range(timestamp_start:datetime, timestamp_end:datetime, days:int=7) -> list:
+    if not isinstance(timestamp_start, datetime):
+        raise TypeError(f"The 'timestamp_start' parameter in shard_range() should be of type <datetime>, passed: {type(timestamp_start)}")
+    if not isinstance(timestamp_end, datetime):
+        raise TypeError(f"The 'timestamp_end' parameter in shard_range() should be of type <datetime>, passed: {type(timestamp_end)}")
+    if not isinstance(days, int):
+        raise TypeError(f"The 'days' parameter in shard_range() should be of type <int>, passed: {type(days)}")
+    if days < 1:
+        raise ValueError(f"The 'days' parameter in shard_range() must be at least 1, passed: {days}")
+
+    shards = []
+    shard_start = timestamp_start
+    while shard_start <= timestamp_end:
+        shard_end = min(shard_start + timedelta(days=days) - timedelta(seconds=1), timestamp_end)
+        shards.append((shard_start, shard_end))
+        shard_start = shard_end + timedelta(seconds=1)
+
+    return shards
+
+"""
+Runs a single API request for the time frame given and returns the data as a list [time, measurements, test, total_num_measurements].
+Falls back to reduce_datapoints() if CHORDS rejects the request for returning too many datapoints. If 'cache_dir' is specified, 
+the responses are cached there (see query_data()).
+"""
+def fetch_range(session:requests.Session, iD:int, timestamp_start:datetime, timestamp_end:datetime, \
+                                                        portal_url:str, user_email:str, api_key:str, cache_dir=None) -> list:
+    if not isinstance(session, requests.Session):
+        raise TypeError(f"The 'session' parameter in fetch_range() should be of type <requests.Session>, passed: {type(session)}")
+    if not isinstance(iD, int):
+        raise TypeError(f"The 'iD' parameter in fetch_range() should be of type <int>, passed: {type(iD)}")
+    if not isinstance(timestamp_start, datetime):
+        raise TypeError(f"The 'timestamp_start' parameter in fetch_range() should be of type <datetime>, passed: {type(timestamp_start)}")
+    if not isinstance(timestamp_end, datetime):
+        raise TypeError(f"The 'timestamp_end' parameter in fetch_range() should be of type <datetime>, passed: {type(timestamp_end)}")
+    if not isinstance(portal_url, str):
+        raise TypeError(f"The 'portal_url' parameter in fetch_range() should be of type <str>, passed: {type(portal_url)}")
+    if not isinstance(user_email, str):
+        raise TypeError(f"The 'user_email' parameter in fetch_range() should be of type <str>, passed: {type(user_email)}")
+    if not isinstance(api_key, str):
+        raise TypeError(f"The 'api_key' parameter in fetch_range() should be of type <str>, passed: {type(api_key)}")
+
+    all_fields = query_data(session, iD, timestamp_start, timestamp_end, portal_url, user_email, api_key, cache_dir)
+    check_errors(all_fields, iD)
+
+    errors = all_fields.get('errors') # check_errors() already raised on the fatal ones, what remains is the excess datapoints message
+    if errors: # reduce timeframe in API call
+        with PRINT_LOCK:
+            print(f"\t Large data request for instrument ID {iD} -- reducing.")
+        return reduce_datapoints(session, errors[0], iD, timestamp_start, timestamp_end, portal_url, user_email, api_key, cache_dir)
+
+    return unpack_data(all_fields['features'][0]['properties']['data'])
+
+"""
+Joins the data of the shards or time windows of one instrument, each a list [time, measurements, test, total_num_measurements]
+in time order, into a single list of the same form.
+"""
+def merge_data(parts:list) -> list:
+    if not isinstance(parts, list):
+        raise TypeError(f"The 'parts' parameter in merge_data() should be of type <list>, passed: {type(parts)}")
+
+    time = []
+    measurements = []
+    test = []
+    total_num_measurements = 0
+    for part in parts:
+        time.extend(part[0])
+        measurements.extend(part[1])
+        test.extend(part[2])
+        total_num_measurements += part[3]
+
+    return [time, measurements, test, total_num_measurements]
+
+
 """
-def create_README(portal_name:str, data_path:str):
+Helper function for create_README() that lays out a portal's units of measurement guide. Accepts the rows of the guide as 
+(sensor name, shortname, measured property, units) tuples, with None for a blank line between groups of sensors and a string for
+a line written as-is, the width of the guide's rules, the tab stops at which the shortname, measured property, and units columns 
+start, and the (title, column header) lines of the guide. Returns the README text.
+"""
+def format_readme(rows:list, rule_width:int, tab_stops:tuple, heading:tuple) -> str:
+    if not isinstance(rows, list):
+        raise TypeError(f"The 'rows' parameter in format_readme() should be of type <list>, passed: {type(rows)}")
+    if not isinstance(rule_width, int):
+        raise TypeError(f"The 'rule_width' parameter in format_readme() should be of type <int>, passed: {type(rule_width)}")
+    if not isinstance(tab_stops, tuple):
+        raise TypeError(f"The 'tab_stops' parameter in format_readme() should be of type <tuple>, passed: {type(tab_stops)}")
+    if not isinstance(heading, tuple):
+        raise TypeError(f"The 'heading' parameter in format_readme() should be of type <tuple>, passed: {type(heading)}")
+
+    def format_line(cells:tuple) -> str:
+        line = '\t' + cells[0]
+        column = 8 + len(cells[0]) # the line starts with a tab, and tabs are 8 columns wide
+        for cell, stop in zip(cells[1:], tab_stops):
+            tabs = 0
+            while tabs == 0 or column < stop: # always at least one tab between columns
+                column = (column // 8 + 1) * 8
+                tabs += 1
+            line += '\t' * tabs + cell
+            column += len(cell)
+        return line + '\n'
+
+    readme = ''.join([
+        '\t' + '=' * rule_width + '\n',
+        '\t' + heading[0] + '\n',
+        '\t' + '=' * rule_width + '\n\n',
+        '\t' + heading[1] + '\n',
+        '\t' + '_' * rule_width + '\n\n',
+    ])
+    for row in rows:
+        if row is None:
+            readme += '\n'
+        elif isinstance(row, str):
+            readme += '\t' + row + '\n'
+        else:
+            readme += format_line((row[0], f'({row[1]})', row[2], f'({row[3]})'))
+
+    return readme
+
+_README_LAYOUTS = { # portal name -> (rows, rule width, tab stops, heading) for format_readme(), None for the portals that have no guide yet
+    'Barbados': (_readme_payloads.BARBADOS_README, 82, (24, 48, 72), _readme_payloads.BARBADOS_HEADING),
+    'Trinidad': (_readme_payloads.TRINIDAD_README, 94, (40, 64, 88), _readme_payloads.TRINIDAD_HEADING),
+    '3D PAWS': (_readme_payloads.THREED_README, 90, (40, 64, 88), _readme_payloads.GUIDE_HEADING),
+    '3D Calibration': (_readme_payloads.THREED_CAL_README, 90, (40, 64, 88), _readme_payloads.GUIDE_HEADING),
+    'FEWSNET': (_readme_payloads.FEWSNET_README, 90, (48, 64, 88), _readme_payloads.GUIDE_HEADING),
+    'Kenya': None, # INSERT KENYA HERE
+    'Cayman Islands': None, # INSERT CAYMAN ISLANDS HERE
+    'Dominican Republic': (_readme_payloads.DOMINICAN_README, 90, (40, 64, 88), _readme_payloads.GUIDE_HEADING),
+}
+
+"""
+Helper function for create_README() that returns the README of the portal encoded with the platform's line endings (like a 
+text-mode write would produce), gzip-compressed if compressed is True, or None if the portal has no README yet. 
+Each README is only laid out the first time it is asked for, and is cached afterwards.
+"""
+@lru_cache(maxsize=None)
+def readme_payload(portal_name:str, compressed:bool=False):
+    if not isinstance(portal_name, str):
+        raise TypeError(f"The 'portal_name' parameter in readme_payload() should be of type <str>, passed: {type(portal_name)}")
+    if not isinstance(compressed, bool):
+        raise TypeError(f"The 'compressed' parameter in readme_payload() should be of type <bool>, passed: {type(compressed)}")
+
+    layout = _README_LAYOUTS[portal_name]
+    if layout is None:
+        return None
+
+    readme = format_readme(*layout).replace('\n', os.linesep).encode('ascii')
+    if compressed:
+        readme = gzip.compress(readme, compresslevel=9, mtime=0) # fixed mtime, so the same README always compresses the same
+
+    return readme
+
+
+"""
+Helper function for create_README() that checks whether the file at 'file_path' already holds exactly 'readme'. The size is checked
+first with os.stat(), so the file is only read back when it could match. Returns True if the README doesn't need to be rewritten.
+"""
+def readme_is_current(file_path:str, readme:bytes) -> bool:
+    if not isinstance(file_path, str):
+        raise TypeError(f"The 'file_path' parameter in readme_is_current() should be of type <str>, passed: {type(file_path)}")
+    if not isinstance(readme, bytes):
+        raise TypeError(f"The 'readme' parameter in readme_is_current() should be of type <bytes>, passed: {type(readme)}")
+
+    try:
+        if os.stat(file_path).st_size != len(readme):
+            return False
+        with open(file_path, 'rb') as file:
+            return file.read() == readme
+    except FileNotFoundError:
+        return False
+
+"""
+Accepts the CHORDS portal name specified by user and creates the correct README associated with that portal in the data_path
+folder, given as a string or a pathlib.Path.
+The README is encoded ahead of time, so it is written straight to the file descriptor without going through the text and buffer layers.
+If compressed is True the README is gzip-compressed and written to README.txt.gz instead, e.g. for data folders that are shipped
+elsewhere alongside compressed csv's.
+"""
+def create_README(portal_name:str, data_path, compressed:bool=False):
     if not isinstance(portal_name, str):
         raise TypeError(f"The 'portal_name' parameter in create_README() should be of type <str>, passed: {type(portal_name)}")
-    if not isinstance(data_path, str):
-        raise TypeError(f"The 'data_path' parameter in create_README() should be of type <str>, passed: {type(data_path)}")
+    if not isinstance(data_path, (str, os.PathLike)):
+        raise TypeError(f"The 'data_path' parameter in create_README() should be of type <str> or <os.PathLike>, passed: {type(data_path)}")
+    if not isinstance(compressed, bool):
+        raise TypeError(f"The 'compressed' parameter in create_README() should be of type <bool>, passed: {type(compressed)}")
     
-    portal_lookup = [
-        'Barbados', 'Trinidad', '3D PAWS', '3D Calibration', 'FEWSNET', 'Kenya', 'Cayman Islands', 'Dominican Republic'
-    ]
-
-    if portal_name in portal_lookup:
-        portal_index = portal_lookup.index(portal_name)
-
-        if portal_index == 0: # Barbados
-            with open(data_path + 'README.txt', 'w') as file: 
-                file.write("\t==================================================================================\n")
-                file.write("\t============================= Units of measurement guide =========================\n")
-                file.write("\t==================================================================================\n\n")
-                file.write("\tSensor name\t(shortname)\t\tMeasured Property\t\t(units)\n")
-                file.write("\t__________________________________________________________________________________\n\n")
-
-                file.write("\tHTU21D_T\t(t1)\t\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tBMP280_T\t(t2)\t\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tMCP9808_T\t(t3)\t\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tHTU21D_RH\t(rh1)\t\t\tHumidity Value\t\t(percent %)\n")
-                file.write("\tBMP280_SLP\t(msl1)\t\t\tAir Pressure Value\t(millibar mbar)\n")
-                file.write("\tBMP280_SP\t(sp1)\t\t\tAir Pressure Value\t(millibar mbar)\n")
-                file.write("\twindspeed\t(ws)\t\t\tWind Speed\t\t(meters per second m/s)\n")
-                file.write("\twinddirection\t(wd)\t\t\tWind Direction\t\t(degrees N degN)\n")
-                file.write("\tprecipitation\t(rain)\t\t\tPrecipitation\t\t(millimeter mm)\n")
-                file.write("\tSI1145_VIS\t(vis1)\t\t\tDownwelling Irradiance\t(watts per square meter W/m^2)\n")
-                file.write("\tSI1145_IR\t(ir1)\t\t\tDownwelling Irradiance\t(watts per square meter W/m^2)\n")
-                file.write("\tSI1145_UV\t(uv1)\t\t\tDownwelling Irradiance\t(watts per square meter W/m^2)\n")
-        
-        if portal_index == 1: # Trinidad
-            with open(data_path + 'README.txt', 'w') as file:
-                file.write("\t==============================================================================================\n")
-                file.write("\t=================================== Units of measurement guide ===============================\n")
-                file.write("\t==============================================================================================\n\n")
-                file.write("\tSensor name\t(shortname)\t\tMeasured Property\t\t\t(units)\n")
-                file.write("\t______________________________________________________________________________________________\n\n")
-
-                file.write("\tBMX280 Temperature\t\t(bt1)\t\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tMCP9808 Temperature\t\t(mt1)\t\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tHTU21D Temperature\t\t(ht1)\t\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tBMX280 Pressure\t\t\t(bp1)\t\t\tAir Pressure Value\t(hectopascal hPa)\n")
-                file.write("\tBMX280 Relative Humidity\t(bh1)\t\t\tHumidity Value\t\t(percent %)\n")
-                file.write("\tHTU21D Relative Humidity\t(hh1)\t\t\tHumidity Value\t\t(percent %)\n")
-                file.write("\tWind Speed\t\t\t(ws)\t\t\tWind Speed\t\t(meters per second m/s)\n")
-                file.write("\tWind Direction\t\t\t(wd)\t\t\tWind Direction\t\t(degrees N degN)\n")
-                file.write("\tWind Gust\t\t\t(wg)\t\t\tWind Speed\t\t(meters per second m/s)\n")
-                file.write("\tWind Gust Direction\t\t(wgd)\t\t\tWind Direction\t\t(degrees N degN)\n")
-                file.write("\tRain Gauge\t\t\t(rg)\t\t\tPrecipitation\t\t(millimeter mm)\n")
-                file.write("\tSI1145 Visible\t\t\t(sv1)\t\t\tDownwelling Irradiance\t(watts per square meter W/m^2)\n")
-                file.write("\tSI1145 Infrared\t\t\t(si1)\t\t\tDownwelling Irradiance\t(watts per square meter W/m^2)\n")
-                file.write("\tSI1145 Ultraviolet\t\t(su1)\t\t\tDownwelling Irradiance\t(watts per square meter W/m^2)\n")
-                file.write("\tBattery Current State\t\t(bcs)\t\t\tState of Health\t\t(count #)\n")
-                file.write("\tBattery Percent Charge\t\t(bpc)\t\t\tState of Health\t\t(percent %)\n")
-                file.write("\tBattery Charge Fault Register\t(cfr)\t\t\tState of Health\t\t(count #)\n")
-                file.write("\tCell Signal Strength\t\t(css)\t\t\tState of Health\t\t(percent %)\n")
-
-        if portal_index == 2: # 3D PAWS
-            with open(data_path + 'README.txt', 'w') as file: 
-                file.write("\t==========================================================================================\n")
-                file.write("\t================================= Units of measurement guide =============================\n")
-                file.write("\t==========================================================================================\n\n")
-                file.write("\tSensor name\t\t\t(shortname)\t\tMeasured Property\t(units)\n")
-                file.write("\t__________________________________________________________________________________________\n\n")
-
-                file.write("\tHTU21D_T\t\t\t(t1)\t\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tHTU21D Temperature\t\t(ht1)\t\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tHIH Temperature 2\t\t(ht2)\t\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tHTU21D_T\t\t\t(htu21d_temp)\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tBMP280_T\t\t\t(t2)\t\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tBMP280_T\t\t\t(bmp_temp)\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tBME_T\t\t\t\t(bme_temp)\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tBMX280 Temperature 1\t\t(bt1)\t\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tMCP9808_T\t\t\t(t3)\t\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tMCP9808_T\t\t\t(mcp9808)\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tMCP9808 Temperature 1\t\t(mt1)\t\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tSHT Temperature\t\t\t(st1)\t\t\tTemperature\t\t(degrees C)\n\n")
-
-                file.write("\tBMP280_ALT\t\t\t(bmp_altitude)\t\tAltitude\t\t(meter m)\n\n")
-
-                file.write("\tBMP280_SLP\t\t\t(msl1)\t\t\tAir Pressure Value\t(millibar mbar)\n")
-                file.write("\tBMP280_SLP\t\t\t(bmp_slp)\t\tAir Pressure Value\t(hectopascal hPa)\n")
-                file.write("\tBMP280_SP\t\t\t(sp1)\t\t\tAir Pressure Value\t(millibar mbar)\n")
-                file.write("\tBMP280_SP\t\t\t(bmp_pressure)\t\tAir Pressure Value\t(hectopascal hPa)\n")
-                file.write("\tBME_StationPres\t\t\t(bme_pressure)\t\tAir Pressure Value\t(hectopascal hPa)\n")
-                file.write("\tBME_SeaLevelPres\t\t(bme_slp)\t\tAir Pressure Value\t(hectopascal hPa)\n")
-                file.write("\tBMX280 Pressure 1\t\t(bp1)\t\t\tAir Pressure Value\t(hectopascal hPa)\n\n")
-
-                file.write("\tWind speed\t\t\t(ws)\t\t\tWind Speed\t\t(meters per second m/s)\n")
-                file.write("\twindspeed\t\t\t(wind_speed)\t\tWind Speed\t\t(meters per second m/s)\n")
-                file.write("\tWind direction\t\t\t(wd)\t\t\tWind Direction\t\t(degrees N degN)\n")
-                file.write("\twinddirection\t\t\t(wind_direction)\tWind Direction\t\t(degrees N degN)\n")
-                file.write("\tWind Gust\t\t\t(wg)\t\t\tWind Speed\t\t(meters per second m/s)\n")
-                file.write("\tWind Gust Direction\t\t(wgd)\t\t\tWind Direction\t\t(degrees N degN)\n\n")
-
-                file.write("\tHTU21D_RH\t\t\t(rh1)\t\t\tHumidity Value\t\t(percent %)\n")
-                file.write("\tHTU21D_RH\t\t\t(htu21d_humidity)\tHumidity Value\t\t(percent %)\n")
-                file.write("\tBMX280 Relative Humidity\t(bh1)\t\t\tHumidity Value\t\t(percent %)\n")
-                file.write("\tBME_RH\t\t\t\t(bme_humidity)\t\tHumidity Value\t\t(percent %)\n")
-                file.write("\tHTU21D Relative Humidity\t(hh1)\t\t\tHumidity Value\t\t(percent %)\n")
-                file.write("\tHIH Humidity 2\t\t\t(hh2)\t\t\tHumidity Value\t\t(percent %)\n")
-                file.write("\tRelative Humidity\t\t(sh1)\t\t\tHumidity Value\t\t(percent %)\n\n")
-
-                file.write("\tRain\t\t\t\t(rain)\t\t\tPrecipitation\t\t(millimeter mm)\n")
-                file.write("\tRain Gauge Total Today\t\t(rgt)\t\t\tPrecipitation\t\t(millimeter mm)\n")
-                file.write("\tStation Rain Gauge\t\t(rg)\t\t\tPrecipitation\t\t(millimeter mm)\n")
-                file.write("\tRain Gauge Total Prior\t\t(rgp)\t\t\tPrecipitation\t\t(millimeter mm)\n")
-                file.write("\tRain_Gauge_Delta_Seconds\t(rgds)\t\t\tTime Measurement Accuracy (seconds s)\n\n")
-
-                file.write("\tWater level\t\t\t(hl)\t\t\tDatum\t\t\t(millimeter mm)\n")
-                file.write("\tWater level outliers\t\t(wlo)\t\t\tNumber of Samples\t(count #)\n")
-                file.write("\tWater level deviation\t\t(wld)\t\t\tDeviation\t\t(millimeter mm)\n")
-                file.write("\tWater level median\t\t(wlm)\t\t\tDatum\t\t\t(millimeter #)\n")
-                file.write("\tWater level raw\t\t\t(wlr)\t\t\tDatum\t\t\t(millimeter mm)\n\n")
-
-                file.write("\tSnow_Depth\t\t\t(sg)\t\t\tDatum\t\t\t(centimeter cm)\n\n")
-
-                file.write("\tSoil Temperature 1\t\t(st1)\t\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tSoil Temperature 2\t\t(st2)\t\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tSoil Temperature 3\t\t(st3)\t\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tSoil Moisture 1\t\t\t(sm1)\t\t\tData Point\t\t(percent saturation % Sat)\n")
-                file.write("\tSoil Moisture 2\t\t\t(sm2)\t\t\tData Point\t\t(kilopascal kPa)\n")
-                file.write("\tSoil Moisture 3\t\t\t(sm3)\t\t\tData Point\t\t(percent saturation % Sat)\n\n")
-
-                file.write("\tSI1145 Visible 1\t\t(sv1)\t\t\tDownwelling Irradiance\t(watts per square meter W/m^2)\n")
-                file.write("\tSI1145 Infrared 1\t\t(si1)\t\t\tDownwelling Irradiance\t(watts per square meter W/m^2)\n")
-                file.write("\tSI1145 Ultraviolet 1\t\t(su1)\t\t\tDownwelling Irradiance\t(watts per square meter W/m^2)\n")
-                file.write("\tSI1145_VIS\t\t\t(vis1)\t\t\tDownwelling Irradiance\t(watts per square meter W/m^2)\n")
-                file.write("\tSI1145_IR\t\t\t(ir1)\t\t\tDownwelling Irradiance\t(watts per square meter W/m^2)\n")
-                file.write("\tSI1145_UV\t\t\t(uv1)\t\t\tDownwelling Irradiance\t(watts per square meter W/m^2)\n")
-                file.write("\tSI1145_VIS\t\t\t(si1145_vis)\t\tDownwelling Irradiance\t(watts per square meter W/m^2)\n")
-                file.write("\tSI1145_IR\t\t\t(si1145_ir)\t\tDownwelling Irradiance\t(watts per square meter W/m^2)\n")
-                file.write("\tSI1145_UV\t\t\t(si1145_uv)\t\tDownwelling Irradiance\t(watts per square meter W/m^2)\n")
-                file.write("\tSP_215\t\t\t\t(solar1)\t\tDownwelling Irradiance\t(watts per square meter W/m^2)\n")
-                file.write("\tSP_212\t\t\t\t(solar2)\t\tDownwelling Irradiance\t(watts per square meter W/m^2)\n")
-                file.write("\tSI1145_visible1\t\t\t(si1145_vis1)\t\tDownwelling Irradiance\t(count #)\n")
-                file.write("\tSI11145_infrared1\t\t(si1145_ir1)\t\tDownwelling Irradiance\t(count #)\n")
-                file.write("\tSI1145_UV1\t\t\t(si1145_uv1)\t\tDownwelling Irradiance\t(count #)\n")
-                file.write("\tSI1145_visible2\t\t\t(si1145_vis2)\t\tDownwelling Irradiance\t(count #)\n")
-                file.write("\tSI1145_infrared2\t\t(si1145_ir2)\t\tDownwelling Irradiance\t(count #)\n")
-                file.write("\tSI1145_UV2\t\t\t(si1145_uv2)\t\tDownwelling Irradiance\t(count #)\n")
-                file.write("\tSI1145_visible3\t\t\t(si1145_vis3)\t\tDownwelling Irradiance\t(count #)\n")
-                file.write("\tSI11145_infrared3\t\t(si1145_ir3)\t\tDownwelling Irradiance\t(count #)\n")
-                file.write("\tSI1145_UV3\t\t\t(si1145_uv3)\t\tDownwelling Irradiance\t(count #)\n")
-                file.write("\tSI1145_visible4\t\t\t(si1145_vis4)\t\tDownwelling Irradiance\t(count #)\n")
-                file.write("\tSI11145_infrared4\t\t(si1145_ir4)\t\tDownwelling Irradiance\t(count #)\n")
-                file.write("\tSI1145_UV4\t\t\t(si1145_uv4)\t\tDownwelling Irradiance\t(count #)\n")
-                file.write("\tVEML770 light sensor\t\t(lx)\t\t\tDownwelling Irradiance\t(count #)\n\n")
-                
-                file.write("\tBattery Current State\t\t(bcs)\t\t\tState of Health\t\t(count #)\n")
-                file.write("\tBattery Percent Charge\t\t(bpc)\t\t\tState of Health\t\t(percent %)\n")
-                file.write("\tBattery Charge Fault Register\t(cfr)\t\t\tState of Health\t\t(count #)\n")
-                file.write("\tBattery Voltage\t\t\t(bv)\t\t\tState of Health\t\t(volts V)\n")
-                file.write("\tCell Signal Strength\t\t(css)\t\t\tState of Health\t\t(percent %)\n")
-                file.write("\tHealth 16bits\t\t\t(hth)\t\t\tState of Health\t\t(count #)\n\n")
-
-        if portal_index == 3: # 3D Calibration
-            with open(data_path + 'README.txt', 'w') as file:
-                file.write("\t==========================================================================================\n")
-                file.write("\t================================= Units of measurement guide =============================\n")
-                file.write("\t==========================================================================================\n\n")
-                file.write("\tSensor name\t\t\t(shortname)\t\tMeasured Property\t(units)\n")
-                file.write("\t__________________________________________________________________________________________\n\n")
-
-                file.write("\tHTU21D_T\t\t\t(htu21d_temp)\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tBMP280_T\t\t\t(bmp_temp)\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tMCP9808_T\t\t\t(mcp9808)\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tHTU21D_T\t\t\t(sht31d_temp)\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tHTU21D_RH\t\t\t(sht31d_humidity)\tHumidity Value\t\t(percent %)\n")
-                file.write("\tHTU21D_RH\t\t\t(htu21d_humidity)\tHumidity Value\t\t(percent %)\n")
-                file.write("\tBMP280_SLP\t\t\t(bmp_slp)\t\tAir Pressure Value\t(millibar mbar)\n")
-                file.write("\tBMP280_SP\t\t\t(bmp_pressure)\t\tAir Pressure Value\t(millibar mbar)\n")
-                file.write("\train\t\t\t\t(rain)\t\t\tPrecipitation\t\t(millimeter mm)\n")
-                file.write("\twindspeed\t\t\t(wind_speed)\t\tWind Speed\t\t(meters per second m/s)\n")
-                file.write("\twinddirection\t\t\t(wind_direction)\tWind Direction\t\t(degrees N degN)\n")
-                file.write("\tWind Gust\t\t\t(wg)\t\t\tWind Speed\t\t(meters per second m/s)\n")
-                file.write("\tWind Gust Direction\t\t(wgd)\t\t\tWind Direction\t\t(degrees N degN)\n")
-                file.write("\tSI1145_VIS\t\t\t(si1145_vis)\t\tRadiance\t\t(watts per square meter W/m^2)\n")
-                file.write("\tSI1145_IR\t\t\t(si1145_ir)\t\tRadiance\t\t(watts per square meter W/m^2)\n")
-                file.write("\tSI1145_UV\t\t\t(si1145_uv)\t\tRadiance\t\t(watts per square meter W/m^2)\n")
-                file.write("\tBattery Percent Charge\t\t(bpc)\t\t\tState of Health\t\t(percent %)\n")
-
-        if portal_index == 4: # FEWSNET
-            with open(data_path + 'README.txt', 'w') as file:
-                file.write("\t==========================================================================================\n")
-                file.write("\t================================= Units of measurement guide =============================\n")
-                file.write("\t==========================================================================================\n\n")
-                file.write("\tSensor name\t\t\t(shortname)\t\tMeasured Property\t(units)\n")
-                file.write("\t__________________________________________________________________________________________\n\n")
-
-                file.write("\tBMX Temperature 1\t\t\t(bt1)\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tBMX Temperature 2\t\t\t(bt2)\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tHTU Temperature 1\t\t\t(ht1)\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tHIH Temperature\t\t\t\t(ht2)\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tSHT Temperature\t\t\t\t(st1)\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tMCP Temperature 1\t\t\t(mt1)\t\tTemperature\t\t(degrees C)\n")
-
-                file.write("\tBMX Humidity 1\t\t\t\t(bh1)\t\tHumidity Value\t\t(percent %)\n")
-                file.write("\tBMX Humidity 2\t\t\t\t(bh2)\t\tHumidity Value\t\t(percent %)\n")
-                file.write("\tHTU Humidity 1\t\t\t\t(hh1)\t\tHumidity Value\t\t(percent %)\n")
-                file.write("\tHIH Humidity\t\t\t\t(hh2)\t\tHumidity Value\t\t(percent %)\n")
-                file.write("\tSHT Humidity\t\t\t\t(sh1)\t\tHumidity Value\t\t(percent %)\n")
-
-                file.write("\tBMX Pressure 1\t\t\t\tt(bp1)\tAir Pressure Value\t(hectopascal hPa)\n")
-                file.write("\tBMX Pressure 2\t\t\t\t\t(bp2)\tAir Pressure Value\t(hectopascal hPa)\n")
-
-                file.write("\tRain Gauge 1\t\t\t\t(rg1)\t\tPrecipitation\t\t(millimeter mm)\n")
-                file.write("\tRain Gauge 2\t\t\t\t(rg2)\t\tPrecipitation\t\t(millimeter mm)\n")
-                file.write("\tRain Gauge 1 Total Today\t(rgt1)\t\t\tPrecipitation\t\t(millimeter mm)\n")
-                file.write("\tRain Gauge 2 Total Today\t(rgt2)\t\t\tPrecipitation\t\t(millimeter mm)\n")
-                file.write("\tRain Gauge 1 Total Prior\t(rgp1)\t\t\tPrecipitation\t\t(millimeter mm)\n")
-                file.write("\tRain Gauge 2 Total Prior\t(rgp2)\t\t\tPrecipitation\t\t(millimeter mm)\n")
-
-                file.write("\tHealth\t\t\t\t(hth)\t\tState of Health\t\t(count #)\n\n")
-                file.write("\tBattery Percent Charge\t\t\t(bpc)\t\tState of Health\t\t(percent %)\n")
-                file.write("\tBattery Current State\t\t\t(bcs)\t\tState of Health\t\t(count #)\n")
-                file.write("\tCell Signal Strength\t\t\t(css)\t\tState of Health\t\t(percent %)\n")
-                file.write("\tBattery Charge Fault Register\t\t(cfr)\t\tState of Health\t\t(count #)\n")
-
-        # INSERT KENYA HERE
-        # INSERT CAYMAN ISLANDS HERE        
-
-        if portal_index == 7: # Dominican Republic
-            with open(data_path + 'README.txt', 'w') as file:
-                file.write("\t==========================================================================================\n")
-                file.write("\t================================= Units of measurement guide =============================\n")
-                file.write("\t==========================================================================================\n\n")
-                file.write("\tSensor name\t\t\t(shortname)\t\tMeasured Property\t(units)\n")
-                file.write("\t__________________________________________________________________________________________\n\n")
-
-                file.write("\tBMP280_T\t\t\t(bt1)\t\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tHTU21D_T\t\t\t(ht1)\t\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tMCP9808\t\t\t\t(mt1)\t\t\tTemperature\t\t(degrees C)\n")
-                file.write("\tHTU21D_RH\t\t\t(hh1)\t\t\tHumidity Value\t\t(percent %)\n")
-                file.write("\tBMP280_SLP\t\t\t(bmp_pressure)\t\tAir Pressure Value\t(hectopascal hPa)\n")
-                file.write("\tBMP280_SP\t\t\t(bp1)\t\t\tAir Pressure Value\t(hectopascal hPa)\n")
-                file.write("\tPrecipitation\t\t\t(rg)\t\t\tPrecipitation\t\t(millimeter mm)\n")
-                file.write("\tWind Speed\t\t\t(ws)\t\t\tWind Speed\t\t(meters per second m/s)\n")
-                file.write("\tWind Direction\t\t\t(wd)\t\t\tWind Direction\t\t(degrees N degN)\n")
-                file.write("\tWind Gust\t\t\t(wg)\t\t\tWind Speed\t\t(meters per second m/s)\n")
-                file.write("\tWind Gust Direction\t\t(wgd)\t\t\tWind Direction\t\t(degrees N degN)\n\n")
-                file.write("\tSI1145_VIS\t\t\t(sv1)\t\t\tRadiance\t\t(watts per square meter W/m^2)\n")
-                file.write("\tSI1145_IR\t\t\t(si1)\t\t\tRadiance\t\t(watts per square meter W/m^2)\n")
-                file.write("\tSI1145_UV\t\t\t(su1)\t\t\tRadiance\t\t(watts per square meter W/m^2)\n")
-                file.write("\tHealth\t\t\t\t(hth)\t\t\tState of Health\t\t(dimensionless)\n\n")
-                file.write("\tBattery Percent Charge\t\t(bpc)\t\t\tState of Health\t\t(percent %)\n")
-
-    else:
+    if portal_name not in _README_LAYOUTS:
         raise ValueError(f"create_README() expects a portal name to be one of the following (case sensitive):\n\t \
                             Barbados, Trinidad, 3D PAWS, 3D Calibration, Kenya, Cayman Islands, or Dominican Republic.")
 
+    readme = readme_payload(portal_name, compressed)
+    if readme is not None:
+        readme_path = os.path.join(os.fspath(data_path), 'README.txt.gz' if compressed else 'README.txt') # used by the check and the write
+        if readme_is_current(readme_path, readme): # e.g. several downloads into the same data folder
+            return 0
+
+        fd = os.open(readme_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+        try:
+            view = memoryview(readme)
+            while view: # os.write() may write less than asked for
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+    return 0
+
+"""
+Creates the README of many data folders at once. Accepts a dictionary mapping each data folder to the CHORDS portal name whose
+README should be created there. The writes are independent, so they are run concurrently to overlap the file system calls.
+See create_README() for 'compressed'.
+"""
+def create_READMEs(portals_by_path:dict, compressed:bool=False):
+    if not isinstance(portals_by_path, dict):
+        raise TypeError(f"The 'portals_by_path' parameter in create_READMEs() should be of type <dict>, passed: {type(portals_by_path)}")
+    if not isinstance(compressed, bool):
+        raise TypeError(f"The 'compressed' parameter in create_READMEs() should be of type <bool>, passed: {type(compressed)}")
+
+    with ThreadPoolExecutor(max_workers=max(1, min(16, len(portals_by_path)))) as executor:
+        for _ in executor.map(lambda item: create_README(item[1], item[0], compressed), portals_by_path.items()): # re-raises any error
+            pass
+
     return 0